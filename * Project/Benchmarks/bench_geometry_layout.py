@@ -0,0 +1,109 @@
+# Parity and timing of the segment geometry engine's layout paths
+#
+# Headless, and without Qt: lays out randomized batches of controls (with
+# and without text and icons, of random sizes and segment counts) with
+# geometry.layoutControls, both segment by segment in Python and vectorized
+# with NumPy, for every combination of flat/non-flat, Linux/Mac (darwin)
+# rules and even/odd trims, and checks that the two agree exactly. Then
+# times both, and the NumPy path returning arrays, on one large batch.
+#
+# Usage:
+#
+#   python bench_geometry_layout.py [--batches N] [--controls N]
+#                                   [--timing-controls N] [--seed N]
+#
+# Exits non-zero if the paths disagree. Needs NumPy (an optional
+# dependency of the package) to compare anything.
+
+
+import argparse
+import os
+import random
+import sys
+import time
+
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          os.pardir, "Source")
+
+PLATFORMS = ("linux", "darwin")
+TRIMS = (30, 31, 7)
+
+
+def randomControls(rng, num_controls, max_segments, geometry):
+    controls_metrics = []
+    for _ in range(num_controls):
+        segments_metrics = []
+        for _ in range(rng.randrange(0, max_segments + 1)):
+            has_text = rng.random() < 0.8
+            has_icon = rng.random() < 0.5 or not has_text
+            segments_metrics.append(geometry.SegmentMetrics(
+                    rng.randrange(20, 200), rng.randrange(15, 40),
+                    rng.randrange(5, 150), rng.randrange(10, 20),
+                    rng.randrange(0, 40), rng.randrange(0, 40),
+                    has_text, has_icon))
+        controls_metrics.append(segments_metrics)
+    return controls_metrics
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batches", type=int, default=300)
+    parser.add_argument("--controls", type=int, default=20)
+    parser.add_argument("--timing-controls", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, SOURCE_DIR)
+    from SegmentedControl import geometry
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("NumPy is not installed; nothing to compare")
+        return 0
+
+    # Parity
+    rng = random.Random(args.seed)
+    mismatches = 0
+    for _ in range(args.batches):
+        controls_metrics = randomControls(rng, args.controls, 8, geometry)
+        for platform in PLATFORMS:
+            for is_flat in (False, True):
+                for trim in TRIMS:
+                    layouts = [geometry.layoutControls(
+                                   controls_metrics, is_flat, trim,
+                                   geometry.MARGIN, platform,
+                                   use_numpy=use_numpy)
+                               for use_numpy in (False, True)]
+                    if (layouts[0] != layouts[1]):
+                        mismatches += 1
+                        print("  Mismatch: platform %s, flat %s, trim %d" %
+                              (platform, is_flat, trim))
+    print("Parity: %d batches x %d controls x %d variants; %d mismatches" %
+          (args.batches, args.controls,
+           len(PLATFORMS) * 2 * len(TRIMS), mismatches))
+
+    # Timing
+    controls_metrics = randomControls(rng, args.timing_controls, 8, geometry)
+    num_segments = sum(len(m) for m in controls_metrics)
+    print("Timing: %d controls, %d segments" %
+          (len(controls_metrics), num_segments))
+    for label, kwargs in (("Python", {}),
+                          ("NumPy", {"use_numpy": True}),
+                          ("NumPy, as arrays", {"as_arrays": True})):
+        seconds = timed(lambda: geometry.layoutControls(controls_metrics,
+                                                        **kwargs))
+        print("  %-18s %8.1f ms" % (label, 1e3 * seconds))
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+# Input-latency stress harness for SegmentedControl
+#
+# Headless (QT_QPA_PLATFORM=offscreen unless set), using QTest: drives a
+# randomized sequence of mouse and keyboard operations across many controls,
+# half of them exclusive and half not, and reports:
+#  * latency from the synthetic event that completes a click (the mouse or
+#    key release) to the buttonClicked and buttonIdClicked emissions
+#  * paint time afterwards: the time spent in SegmentButton.paintEvent
+#    while processing the events the operation left pending - i.e. painting
+#    just the segments it updated - and how many segments that was
+# as p50/p95/p99, and checks, after every operation, each control's state
+# and emitted signals against a reference model.
+#
+# Operations:
+#  * click         - QTest.mousePress then mouseRelease on a segment,
+#                    back to back
+#  * press/release - the same, processing events (painting the pressed
+#                    state) in between
+#  * cancel        - press on a segment, release outside it (no click)
+#  * arrow hold    - focus a segment, then hold down Left or Right
+#                    (auto-repeating) across several segments and release;
+#                    exclusive controls select as they go, but click once, on
+#                    release (keyActivationDelay 0), and only if the
+#                    selection changed
+#
+# Usage:
+#
+#   python bench_input_latency.py [--controls N] [--segments N] [--ops N]
+#                                 [--seed N] [--qt-api pyqt5|pyqt6|...]
+#
+# Exits non-zero if any state or signal mismatches the model.
+
+
+import argparse
+import os
+import random
+import sys
+import time
+
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          os.pardir, "Source")
+
+OPERATIONS = ("click", "press/release", "cancel", "arrow hold")
+
+
+def percentile(samples, fraction):  # Nearest-rank
+    if (not samples):
+        return float("nan")
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1,
+                      int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def reportLatencies(label, samples):
+    print("  %-28s n=%-6d p50 %8.1f us   p95 %8.1f us   p99 %8.1f us" %
+          (label, len(samples),
+           1e6 * percentile(samples, 0.50),
+           1e6 * percentile(samples, 0.95),
+           1e6 * percentile(samples, 0.99)))
+
+
+class ReferenceModel(object):  # Expected state of one control
+
+    def __init__(self, num_segments, is_exclusive):
+        self.states = [False] * num_segments
+        self.is_exclusive = is_exclusive
+
+    def click(self, button_index):
+        if (self.is_exclusive):
+            self.states = [i == button_index for i in range(len(self.states))]
+        else:
+            self.states[button_index] = not self.states[button_index]
+
+    def arrowHold(self, start_index, steps):  # Return the clicked index,
+                                              # or None
+        if (not self.is_exclusive):
+            return None  # Arrows only move the focus
+        button_index = max(0, min(len(self.states) - 1, start_index + steps))
+        if (self.states[button_index]):
+            return None  # Back where it started
+        self.click(button_index)
+        return button_index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--controls", type=int, default=40)
+    parser.add_argument("--segments", type=int, default=6)
+    parser.add_argument("--ops", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--qt-api", default=None,
+                        help="Qt binding to use (sets QT_API)")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if (args.qt_api):
+        os.environ["QT_API"] = args.qt_api
+    sys.path.insert(0, SOURCE_DIR)
+
+    from SegmentedControl import SegmentButton, SegmentedControl
+    from SegmentedControl import qtcompat as qt
+
+    QtCore, QtGui, QtWidgets = qt.QtCore, qt.QtGui, qt.QtWidgets
+    QTest = qt.QtTest.QTest
+    left_button = qt.enum(QtCore.Qt, "MouseButton", "LeftButton")
+    no_modifier = qt.enum(QtCore.Qt, "KeyboardModifier", "NoModifier")
+    key_press = qt.enum(QtCore.QEvent, "Type", "KeyPress")
+    key_release = qt.enum(QtCore.QEvent, "Type", "KeyRelease")
+
+    def sendKey(control, event_type, key, is_auto_repeat=False):
+        QtWidgets.QApplication.sendEvent(control, QtGui.QKeyEvent(
+                event_type, key, no_modifier, "", is_auto_repeat))
+
+    # Time every segment paint
+    painting = {"seconds": 0.0, "segments": 0}
+    original_paint_event = SegmentButton.paintEvent
+
+    def timedPaintEvent(button, event):
+        paint_start = time.perf_counter()
+        original_paint_event(button, event)
+        painting["seconds"] += time.perf_counter() - paint_start
+        painting["segments"] += 1
+
+    SegmentButton.paintEvent = timedPaintEvent
+
+    app = QtWidgets.QApplication([])
+    window = QtWidgets.QWidget()
+    layout = QtWidgets.QVBoxLayout(window)
+
+    # Controls, their models, and what each emitted during the current op
+    controls = []
+    models = []
+    emitted = {"clicked": [], "id_clicked": []}
+
+    def onClicked(button):
+        emitted["clicked"].append((time.perf_counter(), button.index))
+
+    def onIdClicked(button_id):
+        emitted["id_clicked"].append((time.perf_counter(), button_id))
+
+    for control_index in range(args.controls):
+        is_exclusive = (control_index % 2 == 0)
+        control = SegmentedControl(is_exclusive)
+        control.setKeyActivationDelay(0)  # Click on release
+        for button_index in range(args.segments):
+            control.AppendSegmentButton("S%d" % button_index)
+        control.buttonClicked.connect(onClicked)
+        control.buttonIdClicked.connect(onIdClicked)
+        layout.addWidget(control)
+        controls.append(control)
+        models.append(ReferenceModel(args.segments, is_exclusive))
+
+    window.show()
+    app.processEvents()
+
+    rng = random.Random(args.seed)
+    clicked_latencies = []
+    id_clicked_latencies = []
+    key_latencies = []
+    paint_times = []
+    segments_painted = []
+    op_counts = dict((op, 0) for op in OPERATIONS)
+    mismatches = 0
+
+    for _ in range(args.ops):
+        control_index = rng.randrange(len(controls))
+        button_index = rng.randrange(args.segments)
+        op = rng.choice(OPERATIONS)
+        op_counts[op] += 1
+
+        control = controls[control_index]
+        button = control.segment_buttons[button_index]
+        centre = button.rect().center()
+        outside = QtCore.QPoint(-10, -10)
+        del emitted["clicked"][:]
+        del emitted["id_clicked"][:]
+
+        if (op == "click"):
+            QTest.mousePress(button, left_button, no_modifier, centre)
+            start = time.perf_counter()
+            QTest.mouseRelease(button, left_button, no_modifier, centre)
+        elif (op == "press/release"):
+            QTest.mousePress(button, left_button, no_modifier, centre)
+            app.processEvents()  # Let the pressed state paint
+            start = time.perf_counter()
+            QTest.mouseRelease(button, left_button, no_modifier, centre)
+        elif (op == "cancel"):
+            QTest.mousePress(button, left_button, no_modifier, centre)
+            start = time.perf_counter()
+            QTest.mouseRelease(button, left_button, no_modifier, outside)
+        else:
+            steps = rng.randint(1, 2 * args.segments)
+            key = qt.enum(QtCore.Qt, "Key", rng.choice(("Key_Left", "Key_Right")))
+            if (key == qt.enum(QtCore.Qt, "Key", "Key_Left")):
+                steps = -steps
+            control.setFocus()
+            control.setFocusIndex(button_index)
+            sendKey(control, key_press, key)
+            for _ in range(abs(steps) - 1):
+                sendKey(control, key_release, key, True)
+                sendKey(control, key_press, key, True)
+            start = time.perf_counter()
+            sendKey(control, key_release, key)
+
+        # Paint what the operation updated
+        painting["seconds"] = 0.0
+        painting["segments"] = 0
+        app.processEvents()
+        paint_times.append(painting["seconds"])
+        segments_painted.append(painting["segments"])
+
+        # Check signals and state against the model
+        expected_clicks = []
+        if (op == "arrow hold"):
+            clicked_index = models[control_index].arrowHold(button_index, steps)
+            if (clicked_index is not None):
+                expected_clicks = [clicked_index]
+        elif (op != "cancel"):
+            models[control_index].click(button_index)
+            expected_clicks = [button_index]
+        if ([i for _, i in emitted["clicked"]] != expected_clicks or
+                [i for _, i in emitted["id_clicked"]] != expected_clicks or
+                control.getControlState() != models[control_index].states):
+            mismatches += 1
+        if (op == "arrow hold"):
+            key_latencies += [t - start for t, _ in emitted["clicked"]]
+        else:
+            clicked_latencies += [t - start for t, _ in emitted["clicked"]]
+            id_clicked_latencies += [t - start for t, _ in emitted["id_clicked"]]
+
+    print("Binding: %s; %d controls x %d segments; %d ops (%s)" %
+          (qt.bindingName(), args.controls, args.segments, args.ops,
+           ", ".join("%s %d" % (op, op_counts[op]) for op in OPERATIONS)))
+    reportLatencies("release -> buttonClicked", clicked_latencies)
+    reportLatencies("release -> buttonIdClicked", id_clicked_latencies)
+    reportLatencies("key release -> buttonClicked", key_latencies)
+    reportLatencies("segment paints after op", paint_times)
+    print("  Segments painted per op: mean %.2f  max %d" %
+          (float(sum(segments_painted)) / max(1, len(segments_painted)),
+           max(segments_painted or [0])))
+    print("  State/signal mismatches: %d" % mismatches)
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
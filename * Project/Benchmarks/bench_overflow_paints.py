@@ -0,0 +1,140 @@
+# Segment paint counts for an overflow-mode SegmentedControl
+#
+# Headless (QT_QPA_PLATFORM=offscreen unless set): with the paint heatmap
+# on (see paintdebug.py), counts the segment paints of each step of
+#  * scrollBy   - scrolling a control with many segments, in overflow mode,
+#                 right to the end and back in fixed steps
+#  * arrow hold - holding down Right (auto-repeating) from the first
+#                 segment to the last, then Left back again; each key moves
+#                 the focus (and selection), scrolling it into view
+# and reports them.
+#
+# A step should blit what stays visible, and so repaint only the segments
+# it exposes more of, plus - for a key - the segments losing and gaining
+# the focus; any other segment painted is reported as over-painting.
+#
+# Usage:
+#
+#   python bench_overflow_paints.py [--segments N] [--width N] [--step N]
+#                                   [--qt-api pyqt5|pyqt6|...]
+#
+# Exits non-zero if any step over-paints.
+
+
+import argparse
+import os
+import sys
+
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          os.pardir, "Source")
+
+
+def visibleWidths(control):  # Visible width of each segment, in order
+    return [sb.visibleRegion().boundingRect().width()
+            for sb in control.segment_buttons]
+
+
+def measureStep(app, control, step):
+    # Run step(), and return (segments painted, those not allowed to be):
+    # only segments exposed further, or whose focus changed, may repaint
+    widths_before = visibleWidths(control)
+    counts_before = control.paintCounts()
+    focus_before = control.focusIndex()
+    step()
+    app.processEvents()
+    widths_after = visibleWidths(control)
+    refocused = (focus_before, control.focusIndex())
+    painted = [i for i, (before, after) in
+               enumerate(zip(counts_before, control.paintCounts()))
+               if after > before]
+    over_painted = [i for i in painted
+                    if widths_after[i] <= widths_before[i] and
+                    i not in refocused]
+    return (painted, over_painted)
+
+
+def report(label, results):
+    paints = [len(painted) for painted, _ in results]
+    over_paints = sum(len(over_painted) for _, over_painted in results)
+    print("  %-20s steps %-5d segment paints/step: mean %5.2f  max %3d   "
+          "over-painted %d" %
+          (label, len(results), float(sum(paints)) / max(1, len(paints)),
+           max(paints or [0]), over_paints))
+    return over_paints
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--segments", type=int, default=200)
+    parser.add_argument("--width", type=int, default=600)
+    parser.add_argument("--step", type=int, default=40)
+    parser.add_argument("--qt-api", default=None,
+                        help="Qt binding to use (sets QT_API)")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if (args.qt_api):
+        os.environ["QT_API"] = args.qt_api
+    sys.path.insert(0, SOURCE_DIR)
+
+    from SegmentedControl import SegmentedControl
+    from SegmentedControl import qtcompat as qt
+
+    QtCore, QtGui, QtWidgets = qt.QtCore, qt.QtGui, qt.QtWidgets
+    no_modifier = qt.enum(QtCore.Qt, "KeyboardModifier", "NoModifier")
+    key_press = qt.enum(QtCore.QEvent, "Type", "KeyPress")
+    key_release = qt.enum(QtCore.QEvent, "Type", "KeyRelease")
+
+    def sendKey(event_type, key, is_auto_repeat):
+        QtWidgets.QApplication.sendEvent(control, QtGui.QKeyEvent(
+                event_type, key, no_modifier, "", is_auto_repeat))
+
+    def autoRepeatKey(key):
+        sendKey(key_release, key, True)
+        sendKey(key_press, key, True)
+
+    app = QtWidgets.QApplication([])
+    control = SegmentedControl(overflow=True)
+    for button_index in range(args.segments):
+        control.AppendSegmentButton("S%d" % button_index)
+    control.resize(args.width, control.sizeHint().height())
+    control.show()
+    app.processEvents()
+    control.setPaintHeatmapVisible(True)
+    app.processEvents()
+
+    # Scroll to the end and back
+    scroll_results = []
+    for direction in (1, -1):
+        end_offset = control.maxScrollOffset() if direction > 0 else 0
+        while (control.scrollOffset() != end_offset):
+            scroll_results.append(measureStep(
+                    app, control,
+                    lambda: control.scrollBy(direction * args.step)))
+
+    # Hold Right to the last segment, and Left back to the first
+    control.setFocus()
+    control.setFocusIndex(0)
+    app.processEvents()
+    key_results = []
+    for key_name, end_index in (("Key_Right", args.segments - 1),
+                                ("Key_Left", 0)):
+        key = qt.enum(QtCore.Qt, "Key", key_name)
+        sendKey(key_press, key, False)
+        app.processEvents()
+        while (control.focusIndex() != end_index):
+            key_results.append(measureStep(app, control,
+                                           lambda: autoRepeatKey(key)))
+        sendKey(key_release, key, False)
+
+    print("Binding: %s; %d segments, %d px wide; scroll step %d px" %
+          (qt.bindingName(), args.segments, args.width, args.step))
+    over_paints = report("scrollBy", scroll_results)
+    over_paints += report("arrow hold", key_results)
+
+    return 1 if over_paints else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+# Startup benchmark for the SegmentedControl package
+#
+# Measures, each in a fresh interpreter (so that nothing is already cached
+# in sys.modules), for both ways of importing the control:
+#  * "import SegmentedControl" - the recommended, cold-start-safe form,
+#                    constructing SegmentedControl.SegmentedControl()
+#  * "from SegmentedControl import SegmentedControl" - which imports the
+#                    Qt binding at once (reported for comparison)
+# these times:
+#  * import time   - the import statement, and which Qt modules it pulled
+#                    in (should be none for the recommended form)
+#  * first control - time from the first use of the control class up to a
+#                    constructed three-segment control, excluding
+#                    QApplication construction (reported separately)
+# and, also each in a fresh interpreter, which Qt modules importing each of
+# the package's Qt-free modules (geometry, snapshot, ...) pulled in.
+#
+# Usage:
+#
+#   python bench_startup.py [--runs N] [--qt-api pyqt5|pyqt6|pyside6|...]
+#
+# Runs under the "offscreen" Qt platform unless QT_QPA_PLATFORM is set.
+# Exits non-zero if the recommended import, or any Qt-free module, imports
+# Qt.
+
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          os.pardir, "Source")
+
+# Import statement -> expression naming the control class after it
+IMPORT_FORMS = (
+    ("import SegmentedControl", "SegmentedControl.SegmentedControl"),
+    ("from SegmentedControl import SegmentedControl", "SegmentedControl"),
+)
+
+# Sub-modules that must be importable without importing Qt
+QT_FREE_MODULES = ("qtcompat", "geometry", "snapshot", "batchupdate",
+                   "paintdebug")
+
+_CHILD_PREAMBLE = r'''
+import sys, time, json
+sys.path.insert(0, %(source_dir)r)
+
+def qtModules():
+    return sorted(m for m in sys.modules
+                  if m.split(".")[0] in ("PyQt4", "PyQt5", "PyQt6",
+                                         "PySide", "PySide2", "PySide6"))
+'''
+
+# Executed in a child interpreter; prints one JSON result line
+_CHILD_SCRIPT = _CHILD_PREAMBLE + r'''
+t0 = time.perf_counter()
+%(import_statement)s
+t1 = time.perf_counter()
+modules_after_import = qtModules()
+
+from SegmentedControl import qtcompat as qt
+t2 = time.perf_counter()
+app = qt.QtWidgets.QApplication([])
+t3 = time.perf_counter()
+
+t4 = time.perf_counter()
+sc = %(control_class)s()
+for text in ("No", "Maybe", "Yes"):
+    sc.AppendSegmentButton(text)
+t5 = time.perf_counter()
+
+print(json.dumps({
+    "binding": qt.bindingName(),
+    "import_s": t1 - t0,
+    "qapplication_s": t3 - t2,
+    "first_control_s": t5 - t4,
+    "qt_modules_after_import": modules_after_import,
+}))
+'''
+
+# Executed in a child interpreter; prints one JSON result line
+_MODULE_CHILD_SCRIPT = _CHILD_PREAMBLE + r'''
+from SegmentedControl import %(module_name)s
+print(json.dumps({"qt_modules_after_import": qtModules()}))
+'''
+
+
+def runChild(script, env):
+    output = subprocess.check_output([sys.executable, "-c", script], env=env)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--qt-api", default=None,
+                        help="Qt binding to use (sets QT_API)")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if (args.qt_api):
+        env["QT_API"] = args.qt_api
+
+    failed = False
+    for form_index, (import_statement, control_class) in \
+            enumerate(IMPORT_FORMS):
+        script = _CHILD_SCRIPT % {"source_dir": SOURCE_DIR,
+                                  "import_statement": import_statement,
+                                  "control_class": control_class}
+        results = [runChild(script, env) for _ in range(args.runs)]
+
+        print("%s - binding: %s (%d runs, medians)" %
+              (import_statement, results[0]["binding"], args.runs))
+        for key, label in (("import_s", "import"),
+                           ("qapplication_s", "QApplication()"),
+                           ("first_control_s", "first control")):
+            median_ms = 1000 * statistics.median(r[key] for r in results)
+            print("  %-24s %8.3f ms" % (label, median_ms))
+        qt_modules = results[0]["qt_modules_after_import"]
+        print("  Qt modules after import: %s" % (qt_modules or "none"))
+
+        # Fail loudly if the recommended import starts pulling in Qt again
+        if (form_index == 0 and qt_modules):
+            failed = True
+
+    print("Qt-free modules:")
+    for module_name in QT_FREE_MODULES:
+        script = _MODULE_CHILD_SCRIPT % {"source_dir": SOURCE_DIR,
+                                         "module_name": module_name}
+        qt_modules = runChild(script, env)["qt_modules_after_import"]
+        print("  %-24s Qt modules after import: %s" %
+              (module_name, qt_modules or "none"))
+        if (qt_modules):
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+# A Segmented Control Package for PyQt / PySide
+
+#  A compact, glanceable alternative to radio buttons. Particularly suitable
+#  for situations where there is horizontal (but not vertical) space.
+#
+#  Importing this package is cheap: no Qt binding is imported until one of
+#  the classes below is first used (see qtcompat.py for binding selection).
+#  "from SegmentedControl import SegmentedControl" is such a use - it
+#  imports the binding at once - so to keep Qt out of startup, import the
+#  package and look the class up when first constructing a control.
+#
+#  Usage:
+#
+#   import SegmentedControl
+#   sc = SegmentedControl.SegmentedControl()
+#   sc.AppendSegmentButton("No")
+#   sc.AppendSegmentButton("Yes")
+
+
+import importlib
+
+
+__all__ = ["SegmentedControl", "SegmentButton", "SegmentedControlItem"]
+
+# Public name -> sub-module defining it; imported on first access
+_LAZY_ATTRIBUTES = {
+    "SegmentedControl": "control",
+    "SegmentButton": "control",
+    "SegmentedControlItem": "graphicsitem",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if (module_name is None):
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module("." + module_name, __name__), name)
+    globals()[name] = value  # Subsequent lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
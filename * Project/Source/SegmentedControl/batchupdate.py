@@ -0,0 +1,48 @@
+# Batched updates across many SegmentedControls
+#
+# An UpdateGroup wraps SegmentedControl.beginUpdate()/endUpdate() around a
+# set of controls, so that e.g. switching a whole form between read-only and
+# editable relayouts and repaints each control once, at the end, rather
+# than once per property change per segment.
+#
+# Usage:
+#
+#   with batchupdate.UpdateGroup.under(form):
+#       for control in ...:
+#           control.setEnabled(False)
+#           control.setFlat(True)
+#
+# or, without a with statement, group.begin() ... group.end().
+
+
+class UpdateGroup(object):
+
+    def __init__(self, controls):
+        self.controls = list(controls)
+
+    @classmethod
+    def under(cls, parent):
+        # A group of all the SegmentedControls under (and including) parent
+        from .control import SegmentedControl
+
+        controls = parent.findChildren(SegmentedControl)
+        if (isinstance(parent, SegmentedControl)):
+            controls.insert(0, parent)
+        return cls(controls)
+
+    def begin(self):
+        for control in self.controls:
+            control.beginUpdate()
+
+    def end(self):
+        # In reverse, so that nested controls finish before their parents
+        for control in reversed(self.controls):
+            control.endUpdate()
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end()
+        return False
@@ -0,0 +1,931 @@
+# A Segmented Control Class for PyQt
+
+#  A compact, glanceable alternative to radio buttons. Particularly suitable
+#  for situations where there is horizontal (but not vertical) space.
+
+
+# To do:
+
+# * Has been tested under Snow Leopard on the Mac, but may require tuning
+#   to accomodate native look under Mac OS X Lion and beyond.
+#
+# * Currently, the height of the divider makes some use of hard-coded
+#   values
+#
+# * On Snow Leopard on the Mac, with the native look, using icons taller
+#   than the buttons (~25 px high?) breaks the look.
+#   This appears to be a limitation of Qt on the Mac,
+#   using the Mac native look.
+#
+#  * In the unlikely event that the "flat" option is set to True, buttons
+#    don't look right in their down and checked states.
+#    In order to fix this, the paintEvent below would need to be modified.
+#
+# * To acheive flat joining of buttons, a portion of the button
+#   (left, right, or both sides) is "trimmed". Currently,
+#   the number of pixels that are trimmed is hard-coded to be greater than
+#   the radius of any style of rounded corner.
+#   It might be better to base the number of pixels trimmed on the button
+#   curvature, if this can be queried in software...
+#
+# * Currently, a button's minimum size is determined by the contents of
+#   the button (text, icon, or both).
+#   Potentially, the button could alternatively determine the space available
+#   to display its contents (elided text, etc).
+#
+# * Currently, there's no way implemented to set a *maximum* width or height
+#   for the control as a whole
+#
+# * Currently, there's no way implemented to set a *fixed* width or height
+#   for the control as a whole
+#
+# * Currently, there's no "over" or "hover" state; perhaps this would be
+#   desireable
+
+
+import contextlib
+
+from . import geometry
+from . import paintdebug
+from . import palettecache
+from . import qtcompat as qt
+from .qtcompat import QtCore, QtGui, QtWidgets
+
+
+# SegmentedControl class
+#
+# A compact, glanceable alternative to radio buttons; particularly suitable
+# for situations where there is horizontal (but not vertical) space.
+#
+# A control, consisting of a row of SegmentButtons (defined below), such that
+# any rounded corner styling appears at the corners of the control as a whole,
+# and NOT at the corners of each constituent button.
+#
+# The control supports signals typical of QButtonGroups:
+#  * buttonClicked, buttonIdClicked
+#  * buttonPressed, buttonIdPressed
+#  * buttonReleased, buttonIdReleased
+# and, for segments given a key (see segmentForKey etc. below):
+#  * keyClicked
+#
+# In overflow mode (overflow=True), for controls with many segments, the
+# segments are placed in a strip that scrolls horizontally within a viewport,
+# between left/right scroll arrows (the mouse wheel also scrolls). Only the
+# segments intersecting the viewport are painted or receive mouse events, and
+# scrolling blits the strip (QWidget.scroll), repainting only newly exposed
+# segments.
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++
+class SegmentedControl(QtWidgets.QWidget):
+
+    # Signals
+
+    # Button-based
+    buttonClicked = qt.Signal(QtWidgets.QAbstractButton)
+    buttonPressed = qt.Signal(QtWidgets.QAbstractButton)
+    buttonReleased = qt.Signal(QtWidgets.QAbstractButton)
+
+    # ButtonID-based
+    buttonIdClicked = qt.Signal(int)
+    buttonIdPressed = qt.Signal(int)
+    buttonIdReleased = qt.Signal(int)
+
+    # Key-based (segments with a key only)
+    keyClicked = qt.Signal(object)
+
+
+    def __init__(self, is_exclusive=True, parent=None, overflow=False):
+
+        # Init the base class
+        QtWidgets.QWidget.__init__(self, parent)
+
+        # Init class instance variables
+        self.trim_off = geometry.TRIM  # Num picked to be > outer rad. of any button curve
+        self.__is_flat = False
+        self.__is_enabled = True
+        self.__is_paint_heatmap_visible = False
+        self._max_paint_count = 0  # Of paintCounts(); kept by paintdebug.py
+        self.__is_overflow = overflow
+        self.__scroll_offset = 0
+        self.__max_button_height = 0
+        self.__key_index = {}  # Segment key -> SegmentButton
+        self.__update_depth = 0  # Nesting of beginUpdate() calls
+        self.__is_geometry_pending = False  # Deferred by beginUpdate()
+        self.__did_disable_updates = False  # Undone by endUpdate()
+        self.__focus_button = None  # Segment with the keyboard focus
+        self.__pending_activation = None  # Segment to emit clicks for, once
+                                          # arrow keys settle
+        self.__activation_origin = None  # Checked segment before the keys
+        self.__key_activation_delay = 150  # ms
+
+        # Segment Buttons
+        self.segment_buttons = []
+
+        # Layout
+        self.horiz_layout = QtWidgets.QHBoxLayout()
+        self.horiz_layout.setSpacing(self.calcInterSegmentButtonSpacing())
+        self.horiz_layout.setContentsMargins(0, 0, 0, 0)  # space around widgets within a layout
+        if (overflow):
+            self.__initOverflow()  # horiz_layout goes on a scrolling strip
+        else:
+            self.setLayout(self.horiz_layout)
+        # self.setGeometry(0, 0, 400, 100)
+
+        # Button Group
+        self.button_group = QtWidgets.QButtonGroup(self)
+        self.button_group.setExclusive(is_exclusive)
+
+        # Signals
+        # By Button
+        abstract_button = QtWidgets.QAbstractButton
+        qt.overload(self.button_group.buttonClicked, abstract_button).connect(
+                self.buttonClicked.emit)
+        qt.overload(self.button_group.buttonPressed, abstract_button).connect(
+                self.buttonPressed.emit)
+        qt.overload(self.button_group.buttonReleased, abstract_button).connect(
+                self.buttonReleased.emit)
+
+        # By Key
+        qt.overload(self.button_group.buttonClicked, abstract_button).connect(
+                self.__emitKeyClicked)
+
+        # By Button Group ID (idClicked etc. since Qt 5.15; the int overloads
+        # of buttonClicked etc. before that)
+        if (hasattr(self.button_group, "idClicked")):
+            self.button_group.idClicked.connect(self.buttonIdClicked.emit)
+            self.button_group.idPressed.connect(self.buttonIdPressed.emit)
+            self.button_group.idReleased.connect(self.buttonIdReleased.emit)
+        else:
+            self.button_group.buttonClicked[int].connect(
+                    self.buttonIdClicked.emit)
+            self.button_group.buttonPressed[int].connect(
+                    self.buttonIdPressed.emit)
+            self.button_group.buttonReleased[int].connect(
+                    self.buttonIdReleased.emit)
+
+        # Keyboard navigation; the control, not its segments, takes focus
+        self.setFocusPolicy(qt.enum(QtCore.Qt, "FocusPolicy", "StrongFocus"))
+        self.__activation_timer = QtCore.QTimer(self)
+        self.__activation_timer.setSingleShot(True)
+        self.__activation_timer.timeout.connect(self.__activatePending)
+        qt.overload(self.button_group.buttonClicked, abstract_button).connect(
+                self.__followClick)
+
+
+    def __initOverflow(self):
+
+        no_focus = qt.enum(QtCore.Qt, "FocusPolicy", "NoFocus")
+
+        # Scroll arrows
+        self.__scroll_left_button = QtWidgets.QToolButton(self)
+        self.__scroll_left_button.setArrowType(
+                qt.enum(QtCore.Qt, "ArrowType", "LeftArrow"))
+        self.__scroll_right_button = QtWidgets.QToolButton(self)
+        self.__scroll_right_button.setArrowType(
+                qt.enum(QtCore.Qt, "ArrowType", "RightArrow"))
+        for arrow_button, direction in ((self.__scroll_left_button, -1),
+                                        (self.__scroll_right_button, 1)):
+            arrow_button.setAutoRepeat(True)
+            arrow_button.setFocusPolicy(no_focus)
+            arrow_button.clicked.connect(
+                    lambda checked=False, direction=direction:
+                        self.scrollBy(direction * self.scrollStep()))
+
+        # Viewport, clipping the strip of segment buttons; the strip is
+        # positioned (and scrolled) manually, at x = -scroll offset
+        self.__viewport = QtWidgets.QWidget(self)
+        self.__viewport.setAutoFillBackground(True)  # Opaque, so that
+                                                     # scroll() can blit
+        self.__viewport.installEventFilter(self)  # To track resizes
+        self.__strip = QtWidgets.QWidget(self.__viewport)
+        self.__strip.setLayout(self.horiz_layout)
+
+        overflow_layout = QtWidgets.QHBoxLayout()
+        overflow_layout.setSpacing(0)
+        overflow_layout.setContentsMargins(0, 0, 0, 0)
+        overflow_layout.addWidget(self.__scroll_left_button)
+        overflow_layout.addWidget(self.__viewport, 1)
+        overflow_layout.addWidget(self.__scroll_right_button)
+        self.setLayout(overflow_layout)
+        self.__updateScrollButtons()
+
+
+    def sizeHint(self):
+        width = 0
+        height = 0
+        num_buttons = len(self.segment_buttons)
+        if (num_buttons == 0):
+            return QtCore.QSize()
+        for sb in self.segment_buttons:
+            width += sb.sizeHint().width()
+            height = max(height, sb.sizeHint().height())
+        if (self.__is_overflow):
+            width += self.__scrollButtonsWidth()
+        return QtCore.QSize(width, height)
+
+    def minimumSizeHint(self):
+        if (self.__is_overflow and self.segment_buttons):
+            # Room for the arrows and the widest segment; the rest scrolls
+            width = max(sb.sizeHint().width() for sb in self.segment_buttons)
+            return QtCore.QSize(width + self.__scrollButtonsWidth(),
+                                self.__max_button_height)
+        return self.sizeHint()
+
+    def setFlat(self, flat):
+        for sb in self.segment_buttons:
+            sb.setFlat(flat)
+        self.__is_flat = flat
+        self.horiz_layout.setSpacing(self.calcInterSegmentButtonSpacing())
+        self.__geometryChanged()
+
+    def isFlat(self):
+        return self.__is_flat
+
+
+    # Batched updates
+    #
+    # Between beginUpdate() and the matching endUpdate(), the control's
+    # repaints, layout activation and size hint changes are deferred, then
+    # applied once, so that e.g. setFlat, setEnabled and adding segments
+    # don't each relayout and repaint. Calls may be nested. See also
+    # batchUpdate() below, and batchupdate.UpdateGroup (for many controls).
+
+    def beginUpdate(self):
+        self.__update_depth += 1
+        if (self.__update_depth > 1):
+            return
+        # Only disable updates if they aren't already disabled on the control
+        # itself (updatesEnabled() also reflects a parent's), so endUpdate
+        # re-enables just what this disabled, leaving parents in charge
+        self.__did_disable_updates = not self.testAttribute(
+                qt.enum(QtCore.Qt, "WidgetAttribute", "WA_ForceUpdatesDisabled"))
+        if (self.__did_disable_updates):
+            self.setUpdatesEnabled(False)  # Also disables the segments' updates
+        for layout in self.__layouts():
+            layout.setEnabled(False)
+
+    def endUpdate(self):
+        if (self.__update_depth == 0):
+            return
+        self.__update_depth -= 1
+        if (self.__update_depth > 0):
+            return
+        for layout in self.__layouts():
+            layout.setEnabled(True)
+        if (self.__is_geometry_pending):
+            self.__is_geometry_pending = False
+            self.__applyGeometryChange()
+        for layout in self.__layouts():
+            layout.activate()
+        # Repaints the control, once - unless its own or a parent's updates
+        # are still disabled (it then repaints when they are re-enabled)
+        if (self.__did_disable_updates):
+            self.__did_disable_updates = False
+            self.setUpdatesEnabled(True)
+
+    def isUpdating(self):  # Between beginUpdate() and endUpdate()?
+        return self.__update_depth > 0
+
+    @contextlib.contextmanager
+    def batchUpdate(self):
+        # with control.batchUpdate(): ... - as beginUpdate()/endUpdate()
+        self.beginUpdate()
+        try:
+            yield self
+        finally:
+            self.endUpdate()
+
+    def __layouts(self):
+        if (self.__is_overflow):
+            return (self.layout(), self.horiz_layout)
+        return (self.horiz_layout,)
+
+    def __geometryChanged(self):
+        # The segments' sizes or spacing have changed
+        if (self.__update_depth > 0):
+            self.__is_geometry_pending = True
+        else:
+            self.__applyGeometryChange()
+
+    def __applyGeometryChange(self):
+        if (self.__is_overflow):
+            self.__updateStripGeometry()
+        self.updateGeometry()
+
+
+    def setEnabled(self, enabled):
+        for sb in self.segment_buttons:
+            sb.setEnabled(enabled)
+        self.__is_enabled = enabled
+        self.setFocusPolicy(qt.enum(QtCore.Qt, "FocusPolicy",
+                                    "StrongFocus" if enabled else "NoFocus"))
+        if (not enabled):
+            self.__cancelPendingActivation()
+    def isEnabled(self):
+        return self.__is_enabled
+
+
+    def setPaintHeatmapVisible(self, visible):  # Debug aid; see paintdebug.py
+        visible = bool(visible)
+        if (visible != self.__is_paint_heatmap_visible):
+            self.__is_paint_heatmap_visible = visible
+            paintdebug._heatmapShown(self, visible)
+            for sb in self.segment_buttons:
+                sb.update()
+    def isPaintHeatmapVisible(self):
+        return self.__is_paint_heatmap_visible
+
+    def paintCounts(self):  # Cumulative paints per segment, in segment_buttons
+                            # order (only counted while a paint aid is in use)
+        return [sb.paint_count for sb in self.segment_buttons]
+
+    def resetPaintCounts(self):
+        self._max_paint_count = 0
+        for sb in self.segment_buttons:
+            sb.paint_count = 0
+            sb.update()
+
+
+    def isOverflow(self):
+        return self.__is_overflow
+
+    def scrollOffset(self):  # Pixels scrolled, from the left (overflow mode)
+        return self.__scroll_offset
+
+    def maxScrollOffset(self):
+        if (not self.__is_overflow):
+            return 0
+        return max(0, self.__strip.width() - self.__viewport.width())
+
+    def setScrollOffset(self, offset):
+        if (not self.__is_overflow):
+            return
+        offset = max(0, min(int(offset), self.maxScrollOffset()))
+        dx = self.__scroll_offset - offset
+        if (dx == 0):
+            return
+        self.__scroll_offset = offset
+        # Moves the strip and blits what stays visible; only the newly
+        # exposed area (i.e. newly visible segments) is repainted
+        self.__viewport.scroll(dx, 0)
+        self.__updateScrollButtons()
+
+    def scrollBy(self, dx):
+        self.setScrollOffset(self.__scroll_offset + dx)
+
+    def scrollStep(self):  # Pixels scrolled per arrow click / wheel notch
+        if (not self.__is_overflow):
+            return 0
+        return max(1, self.__viewport.width() // 4)
+
+    def ensureSegmentVisible(self, button_index):
+        if (not self.__is_overflow or
+                not 0 <= button_index < len(self.segment_buttons)):
+            return
+        sb_rect = self.segment_buttons[button_index].geometry()  # Strip coords
+        if (sb_rect.left() < self.__scroll_offset):
+            self.setScrollOffset(sb_rect.left())
+        elif (sb_rect.right() >= self.__scroll_offset + self.__viewport.width()):
+            self.setScrollOffset(sb_rect.right() + 1 - self.__viewport.width())
+
+    def wheelEvent(self, event):
+        if (not self.__is_overflow):
+            return QtWidgets.QWidget.wheelEvent(self, event)
+        if (hasattr(event, "angleDelta")):
+            delta = event.angleDelta()
+            notches = (delta.y() or delta.x()) / 120.0
+        else:  # Qt4
+            notches = event.delta() / 120.0
+        self.scrollBy(int(-notches * self.scrollStep()))
+        event.accept()
+
+    def eventFilter(self, watched, event):
+        if (self.__is_overflow and watched is self.__viewport and
+                event.type() == qt.enum(QtCore.QEvent, "Type", "Resize")):
+            self.__updateStripGeometry()
+        return QtWidgets.QWidget.eventFilter(self, watched, event)
+
+    def __scrollButtonsWidth(self):
+        return (self.__scroll_left_button.sizeHint().width() +
+                self.__scroll_right_button.sizeHint().width())
+
+    def __updateStripGeometry(self):
+        # Strip is as wide as its segments need, as tall as the viewport
+        self.__strip.resize(self.horiz_layout.sizeHint().width(),
+                            self.__viewport.height())
+        self.__scroll_offset = max(0, min(self.__scroll_offset,
+                                          self.maxScrollOffset()))
+        self.__strip.move(-self.__scroll_offset, 0)
+        self.__updateScrollButtons()
+
+    def __updateScrollButtons(self):
+        self.__scroll_left_button.setEnabled(self.__scroll_offset > 0)
+        self.__scroll_right_button.setEnabled(
+                self.__scroll_offset < self.maxScrollOffset())
+
+
+    def setExclusive(self, is_exclusive):
+        self.button_group.setExclusive(is_exclusive)
+    def isExclusive(self):
+        return self.button_group.exclusive()
+
+
+    def getControlState(self):  # Return as a list - in the order of the
+                                # segment_buttons list - of true/false values
+        button_states = []
+        for sb in self.segment_buttons:
+            button_states.append(sb.isChecked())
+        return button_states
+
+
+    def getButtonState(self, button_index):  # Return as a list - in the order of the
+                                             # segment button list; true/false values
+        if (button_index < len(self.segment_buttons)):  # Ensure button index not too
+                                                        # large to be in list
+            return self.segment_buttons[button_index].isChecked()
+
+    def setButtonState(self, button_index, state):
+        if (button_index < len(self.segment_buttons)):  # Make sure button index
+                                                        # is not too large to be
+                                                        # in list
+            self.segment_buttons[button_index].setChecked(state)
+
+
+
+    def AppendSegmentButton(self, sb_text_str, sb_icon_path="",
+                            sb_icon_size=QtCore.QSize(), key=None):
+        return self.InsertSegmentButton(len(self.segment_buttons), sb_text_str,
+                                        sb_icon_path, sb_icon_size, key)
+
+    def InsertSegmentButton(self, button_index, sb_text_str, sb_icon_path="",
+                            sb_icon_size=QtCore.QSize(), key=None):
+
+        # Clamp the index to the list
+        button_index = max(0, min(button_index, len(self.segment_buttons)))
+
+        # Keys must be unique within the control
+        if (key is not None and key in self.__key_index):
+            raise ValueError("Duplicate segment key: %r" % (key,))
+
+        # Create the button; its left-hand/central/right-hand position is
+        # settled once it's in the list
+        sb = SegmentButton(button_index, SegmentButton.SEGMENT_BUTTON_POS_CENTRAL,
+                           self.isEnabled(), False, self.trim_off, parent=self)
+
+        # Flat?
+        sb.setFlat(False)
+        if (self.isFlat()):
+            sb.setFlat(True)
+
+        # Text and icon
+        sb.setText(sb_text_str)
+        if (sb_icon_path):
+            sb.setIcon(QtGui.QIcon(sb_icon_path))
+            sb.setIconSize(sb_icon_size)
+
+        # Key
+        sb.key = key
+        if (key is not None):
+            self.__key_index[key] = sb
+
+        # Insert the button into the list of buttons, and renumber the
+        # buttons that follow it (index == button group id == list position)
+        self.segment_buttons.insert(button_index, sb)
+        for following_index in range(button_index + 1, len(self.segment_buttons)):
+            following_sb = self.segment_buttons[following_index]
+            following_sb.index = following_index
+            self.button_group.setId(following_sb, following_index)
+
+        # Only the new button's neighbours can change position
+        for neighbour_index in (button_index - 1, button_index, button_index + 1):
+            self.__updateLrcPosition(neighbour_index)
+
+        # Ensure that all buttons in the control are still the same height
+        # (only the new button needs sizing, unless it is the tallest yet)
+        sb_hint = sb.sizeHint()
+        if (sb_hint.height() > self.__max_button_height):
+            self.__max_button_height = sb_hint.height()
+            for other_sb in self.segment_buttons:
+                if (other_sb is not sb):
+                    other_sb.setMinimumSize(other_sb.sizeHint().width(),
+                                            self.__max_button_height)
+        sb.setMinimumSize(sb_hint.width(), self.__max_button_height)
+
+        # Add the button to the layout
+        self.horiz_layout.insertWidget(button_index, sb)
+        self.__geometryChanged()
+
+        # Add the button to the button group, along with its index
+        self.button_group.addButton(sb, button_index)
+
+        # Return the button's list index
+        return button_index
+
+    def RemoveSegmentButton(self, button_index):
+        if (not 0 <= button_index < len(self.segment_buttons)):  # Ignore bad
+            return                                               # indexes
+
+        sb = self.segment_buttons.pop(button_index)
+        if (sb.key is not None):
+            del self.__key_index[sb.key]
+        if (sb is self.__focus_button):
+            self.__focus_button = None
+        if (sb is self.__pending_activation):
+            self.__cancelPendingActivation()
+        self.button_group.removeButton(sb)
+        self.horiz_layout.removeWidget(sb)
+        sb.hide()
+        sb.deleteLater()
+
+        # Renumber the buttons that followed it
+        for following_index in range(button_index, len(self.segment_buttons)):
+            following_sb = self.segment_buttons[following_index]
+            following_sb.index = following_index
+            self.button_group.setId(following_sb, following_index)
+
+        # The removed button's neighbours may now be at an end
+        for neighbour_index in (button_index - 1, button_index):
+            self.__updateLrcPosition(neighbour_index)
+
+        # If the tallest button went, the rest may shrink
+        if (sb.sizeHint().height() >= self.__max_button_height):
+            self.__max_button_height = max(
+                    [other_sb.sizeHint().height()
+                     for other_sb in self.segment_buttons] or [0])
+            for other_sb in self.segment_buttons:
+                other_sb.setMinimumSize(other_sb.sizeHint().width(),
+                                        self.__max_button_height)
+
+        # Likewise the most painted one
+        if (sb.paint_count >= self._max_paint_count):
+            self._max_paint_count = max(self.paintCounts() or [0])
+
+        self.__geometryChanged()
+
+    def __updateLrcPosition(self, button_index):
+        num_buttons = len(self.segment_buttons)
+        if (button_index < 0 or button_index >= num_buttons):
+            return
+        lrc_position = geometry.lrcPosition(button_index, num_buttons)
+        sb = self.segment_buttons[button_index]
+        if (sb.lrc_position != lrc_position):
+            sb.lrc_position = lrc_position
+            sb.update()
+
+
+    # Keyed segments
+    #
+    # Segments may carry a (hashable, unique) user key, e.g. an enum value,
+    # given when the segment is added. Keys are indexed, so lookups by key
+    # are O(1) regardless of the number of segments.
+
+    def segmentForKey(self, key):  # Return the SegmentButton, or None
+        return self.__key_index.get(key)
+
+    def setSegmentKey(self, button_index, key):
+        if (not 0 <= button_index < len(self.segment_buttons)):
+            return
+        sb = self.segment_buttons[button_index]
+        if (key is not None and self.__key_index.get(key, sb) is not sb):
+            raise ValueError("Duplicate segment key: %r" % (key,))
+        if (sb.key is not None):
+            del self.__key_index[sb.key]
+        sb.key = key
+        if (key is not None):
+            self.__key_index[key] = sb
+
+    def setCurrentKey(self, key):  # Check the segment with the given key
+                                   # (without emitting click signals)
+        sb = self.__key_index.get(key)
+        if (sb is not None):
+            sb.setChecked(True)
+
+    def currentKey(self):  # Key of the checked segment (exclusive controls),
+                           # or None
+        sb = self.button_group.checkedButton()
+        if (sb is None):
+            return None
+        return sb.key
+
+    def __emitKeyClicked(self, sb):
+        if (sb.key is not None):
+            self.keyClicked.emit(sb.key)
+
+
+    # Keyboard navigation
+    #
+    # The control takes the keyboard focus (its segments don't): Left/Right
+    # move the focus to the previous/next segment, Home/End to the first/
+    # last one, and Space clicks the focused segment. In exclusive controls
+    # the selection follows the focus at once, but the click signals
+    # (buttonClicked, buttonIdClicked, keyClicked) are coalesced: they are
+    # emitted once the key is released and no other arrow key follows within
+    # keyActivationDelay() ms - so holding an arrow key down across many
+    # segments emits them once, for the segment it stops on (and not at all
+    # if that is the segment it started on). Each move repaints only the
+    # segments losing and gaining the focus.
+
+    def focusIndex(self):  # Index of the segment with the keyboard focus,
+                           # or None
+        if (self.__focus_button is None):
+            return None
+        return self.__focus_button.index
+
+    def setFocusIndex(self, button_index):  # Move the keyboard focus (only)
+        if (0 <= button_index < len(self.segment_buttons)):
+            self.__setFocusButton(self.segment_buttons[button_index])
+
+    def setKeyActivationDelay(self, msecs):
+        self.__key_activation_delay = max(0, msecs)
+
+    def keyActivationDelay(self):
+        return self.__key_activation_delay
+
+    def keyPressEvent(self, event):
+        key = event.key()
+        num_buttons = len(self.segment_buttons)
+        if (not self.__is_enabled or num_buttons == 0):
+            return QtWidgets.QWidget.keyPressEvent(self, event)
+
+        # Where the focus is, or else the selection
+        current_sb = self.__focus_button or self.button_group.checkedButton()
+        current_index = current_sb.index if current_sb is not None else -1
+
+        step = -1 if self.isRightToLeft() else 1
+        if (key == qt.enum(QtCore.Qt, "Key", "Key_Left")):
+            button_index = current_index - step
+        elif (key == qt.enum(QtCore.Qt, "Key", "Key_Right")):
+            button_index = current_index + step
+        elif (key == qt.enum(QtCore.Qt, "Key", "Key_Home")):
+            button_index = 0
+        elif (key == qt.enum(QtCore.Qt, "Key", "Key_End")):
+            button_index = num_buttons - 1
+        elif (key in (qt.enum(QtCore.Qt, "Key", "Key_Space"),
+                      qt.enum(QtCore.Qt, "Key", "Key_Select"))):
+            if (not event.isAutoRepeat()):
+                self.__clickFocused()
+            return
+        else:
+            return QtWidgets.QWidget.keyPressEvent(self, event)
+
+        # Hold back the clicks until the key is released
+        button_index = max(0, min(num_buttons - 1, button_index))
+        self.__activation_timer.stop()
+        self.__moveFocus(self.segment_buttons[button_index])
+
+    def keyReleaseEvent(self, event):
+        if (event.isAutoRepeat() or self.__pending_activation is None):
+            return QtWidgets.QWidget.keyReleaseEvent(self, event)
+        if (self.__key_activation_delay > 0):
+            self.__activation_timer.start(self.__key_activation_delay)
+        else:
+            self.__activatePending()
+
+    def focusInEvent(self, event):
+        if (self.__focus_button is None):
+            self.__focus_button = self.button_group.checkedButton() or \
+                (self.segment_buttons[0] if self.segment_buttons else None)
+        if (self.__focus_button is not None):
+            self.__focus_button.update()
+        # Not QWidget.focusInEvent: it would update() - and so repaint every
+        # segment of - the whole control; only the focus rect changes
+        event.accept()
+
+    def focusOutEvent(self, event):
+        self.__activatePending()  # Don't wait for a key release that won't
+                                  # come here
+        if (self.__focus_button is not None):
+            self.__focus_button.update()
+        event.accept()  # See focusInEvent
+
+    def __moveFocus(self, sb):
+        self.__setFocusButton(sb)
+        self.ensureSegmentVisible(sb.index)
+        if (not self.isExclusive() or sb.isChecked()):
+            return
+
+        # Select at once; activate later
+        if (self.__pending_activation is None):
+            self.__activation_origin = self.button_group.checkedButton()
+        sb.setChecked(True)
+        self.__pending_activation = sb
+
+    def __setFocusButton(self, sb):
+        if (sb is self.__focus_button):
+            return
+        old_focus_button = self.__focus_button
+        self.__focus_button = sb
+        if (self.hasFocus()):
+            if (old_focus_button is not None):
+                old_focus_button.update()
+            sb.update()
+
+    def __clickFocused(self):
+        if (self.__pending_activation is not None):
+            self.__activatePending()  # It is the focused segment
+        elif (self.__focus_button is not None):
+            self.__focus_button.click()
+
+    def __activatePending(self):
+        sb = self.__pending_activation
+        origin = self.__activation_origin
+        self.__cancelPendingActivation()
+        if (sb is None or sb is origin or
+                sb.index >= len(self.segment_buttons) or
+                self.segment_buttons[sb.index] is not sb):
+            return
+        self.buttonClicked.emit(sb)
+        self.buttonIdClicked.emit(sb.index)
+        self.__emitKeyClicked(sb)
+
+    def __cancelPendingActivation(self):
+        self.__activation_timer.stop()
+        self.__pending_activation = None
+        self.__activation_origin = None
+
+    def __followClick(self, sb):  # A click (by mouse, or click()) moves the
+                                  # focus, and supersedes any pending one
+        self.__cancelPendingActivation()
+        self.__setFocusButton(sb)
+
+
+    def calcInterSegmentButtonSpacing(self):
+        return geometry.interSegmentSpacing(self.__is_flat)
+# ------------------------------------------------------
+
+
+
+#  SegmentButton class
+#
+#  A button, derived from QPushbutton, capable of drawing itself in left-hand,
+#  central, and right-hand variations that, when placed side by side (using the
+#  SegmentedControl class above), form a control with any styled rounded
+#  corners appearing only at the ends of the control as a whole.
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++
+class SegmentButton(QtWidgets.QPushButton):
+
+    # Aliases of the geometry module's constants (see geometry.py)
+    SEGMENT_BUTTON_POS_LEFTMOST = geometry.POS_LEFTMOST  # Left-hand, central,
+    SEGMENT_BUTTON_POS_CENTRAL = geometry.POS_CENTRAL    # or right-hand
+    SEGMENT_BUTTON_POS_RIGHTMOST = geometry.POS_RIGHTMOST
+
+    SEGMENT_BUTTON_SHIFT_HORIZONTAL = geometry.SHIFT_HORIZONTAL
+    SEGMENT_BUTTON_SHIFT_VERTICAL = geometry.SHIFT_VERTICAL
+
+    SEGMENT_BUTTON_TEXT_ICON_SPACING = geometry.TEXT_ICON_SPACING
+
+    SEGMENT_BUTTON_MARGIN = geometry.MARGIN
+
+    def __init__(self, index, lrc_position,
+                 enabled, selected, trim, parent=None):
+
+        # Init the base class
+        QtWidgets.QPushButton.__init__(self, parent)
+
+        # Make the button a checkable button
+        self.setCheckable(True)
+
+        # Int class instance variables
+        self.index = index
+        self.key = None  # Optional user key; see SegmentedControl.segmentForKey
+        self.control = parent  # The SegmentedControl (parent may be reassigned
+                               # by layouts, e.g. in overflow mode)
+        self.lrc_position = lrc_position
+        self.setEnabled(enabled)
+        self.setChecked(selected)
+        self.trim = trim
+        self.__margin = SegmentButton.SEGMENT_BUTTON_MARGIN
+        self.paint_count = 0  # Maintained only while paint debugging is active
+        self._paint_flash_clear_region = None  # See paintdebug.py
+        self.__pens = None  # Shared pens for this button's palette
+        self.setFlat(parent.isFlat()) #Only really makes sense to set to True on a Mac...
+
+        # Prevent any button within the segmented control from having a focus
+        # rectangle; the control takes the focus, and draws it on a segment
+        self.setFocusPolicy(qt.enum(QtCore.Qt, "FocusPolicy", "NoFocus"))
+
+        # Hook up signals
+        # self.clicked.connect(self.got_clicked)
+
+    def paintEvent(self, event):
+
+        painter = QtWidgets.QStylePainter(self)
+
+        option = QtWidgets.QStyleOptionButton()
+        self.initStyleOption(option)
+
+        option.text = ""
+        option.icon = QtGui.QIcon()
+
+        # Lay out button shape/bg - trimming side(s) if necessary - and
+        # text and/or icon
+        text_bounds = self.fontMetrics().boundingRect(self.text())
+        (trimmed_rect, text_rect, icon_pos, divider) = geometry.segmentContent(
+                self.lrc_position, option.rect.width(), option.rect.height(),
+                text_bounds.width(), text_bounds.height(),
+                self.iconSize().width(), self.iconSize().height(),
+                bool(self.text()), not self.icon().isNull(),
+                self.isFlat(), self.isEnabled() and self.isDown(),
+                self.trim, self.__margin)
+
+        # Draw button shape/bg
+        option.rect = QtCore.QRect(*trimmed_rect)
+        self.style().drawControl(
+                qt.enum(QtWidgets.QStyle, "ControlElement", "CE_PushButton"),
+                option, painter)
+
+        # Draw text
+        if (self.text()):
+            painter.setPen(self.segmentPen(palettecache.TEXT))
+            painter.drawText(QtCore.QRect(*text_rect),
+                             qt.enum(QtCore.Qt, "AlignmentFlag", "AlignLeft"),
+                             self.text())
+
+        # Draw icon
+        if (not self.icon().isNull()):
+            self.drawSegmentIcon(painter, QtCore.QPoint(*icon_pos))
+
+        # Draw border lines manually for between button segments
+        # (if button outlines are being drawn...)
+        if (divider is not None):
+            (divider_x, divider_top, divider_bottom) = divider
+            painter.setPen(self.segmentPen(palettecache.DIVIDER))
+            painter.drawLine(divider_x, divider_top, divider_x, divider_bottom)
+
+        # Draw the keyboard focus indicator
+        if (self.control.hasFocus() and self.control.focusIndex() == self.index):
+            self.drawSegmentFocusRect(painter)
+
+        # Paint debugging aids (flash, heatmap), if any are in use
+        if (paintdebug.active):
+            paintdebug.afterPaint(self, painter, event)
+
+    def drawSegmentIcon(self, painter, pos):
+
+        # Determine version of icon
+        if (self.isEnabled()):
+            enabled_or_disabled_icon = qt.enum(QtGui.QIcon, "Mode", "Normal")
+        else:
+            enabled_or_disabled_icon = qt.enum(QtGui.QIcon, "Mode", "Disabled")
+        # Selected?
+        if (self.isChecked()):
+            checked_or_unchecked_icon = qt.enum(QtGui.QIcon, "State", "On")
+        else:
+            checked_or_unchecked_icon = qt.enum(QtGui.QIcon, "State", "Off")
+        pixmap = self.icon().pixmap(QtCore.QSize(self.iconSize().width(),
+                                                 self.iconSize().height()),
+                                                 enabled_or_disabled_icon,
+                                                 checked_or_unchecked_icon)
+
+        # Draw icon
+        painter.drawPixmap(pos, pixmap)
+
+    def drawSegmentFocusRect(self, painter):
+        focus_option = QtWidgets.QStyleOptionFocusRect()
+        focus_option.initFrom(self)
+        focus_option.state |= (  # The segment itself never has the focus
+                qt.enum(QtWidgets.QStyle, "StateFlag", "State_HasFocus") |
+                qt.enum(QtWidgets.QStyle, "StateFlag", "State_KeyboardFocusChange"))
+        focus_option.rect = self.rect().adjusted(3, 3, -3, -3)
+        focus_option.backgroundColor = self.palette().color(
+                qt.enum(QtGui.QPalette, "ColorRole", "Button"))
+        self.style().drawPrimitive(
+                qt.enum(QtWidgets.QStyle, "PrimitiveElement", "PE_FrameFocusRect"),
+                focus_option, painter, self)
+
+    def segmentPen(self, role):  # Cached, palette-derived pen for the
+                                 # button's current state; see palettecache.py
+        if (self.__pens is None):
+            self.__pens = palettecache.pensFor(self.palette())
+        return self.__pens[(self.isEnabled(), self.isChecked(), role)]
+
+    def determineTextColor(self):
+        return self.segmentPen(palettecache.TEXT).color()
+
+    def determineDividerColor(self):
+        return self.segmentPen(palettecache.DIVIDER).color()
+
+    def changeEvent(self, event):
+        if (event.type() in (qt.enum(QtCore.QEvent, "Type", "PaletteChange"),
+                             qt.enum(QtCore.QEvent, "Type", "StyleChange"))):
+            self.__pens = None
+            palettecache.invalidate()
+        QtWidgets.QPushButton.changeEvent(self, event)
+
+    def sizeHint(self):  # *** May need work....
+        val = QtWidgets.QPushButton.sizeHint(self)
+        val.setWidth(val.width() + geometry.sizeHintExtraWidth(
+                self.trim, self.__margin, bool(self.text()),
+                not self.icon().isNull(), self.isFlat()))
+        return val
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def calcSeperatorButtonRectTopOffset(self):
+        return geometry.separatorInsets(self.isFlat())[0]
+
+    def calcSeperatorButtonRectBottomOffset(self):
+        return geometry.separatorInsets(self.isFlat())[1]
+
+# ------------------------------------------------------
+# -----------------------------------------------------------------------------
@@ -0,0 +1,391 @@
+# Segment geometry engine
+#
+# The rules that decide segment widths, trimming, divider positions and
+# text/icon offsets, as pure functions of plain numbers: no widgets, and no
+# Qt. SegmentButton, SegmentedControlItem and any other renderer (e.g. item
+# delegates) share them, and they can be exercised without a display.
+#
+# Style- and font-dependent inputs are measured by the caller and passed in
+# as SegmentMetrics:
+#  * base_width, base_height - the plain push button size for the segment's
+#                              contents (i.e. QPushButton.sizeHint, or
+#                              QStyle.sizeFromContents(CT_PushButton, ...))
+#  * text_width, text_height - QFontMetrics.boundingRect(text) size
+#  * icon_width, icon_height - icon size
+#  * has_text, has_icon
+#
+# A note on trimming: to join segments flatly, each segment draws a button
+# wider than itself - "trimmed" on the side(s) that abut other segments -
+# so that any rounded corners fall outside the segment and are clipped.
+#
+# Rects are (x, y, width, height) tuples; positions are (x, y) tuples.
+#
+# layoutSegments() lays out one control, layoutControls() many at once;
+# the latter can use NumPy (an optional dependency) to vectorize large
+# batches.
+
+
+import collections
+import sys
+
+
+# Segment positions
+POS_LEFTMOST = 0
+POS_CENTRAL = 1
+POS_RIGHTMOST = 2
+
+SHIFT_HORIZONTAL = 1  # QStyle.PM_ButtonShiftHorizontal
+                      # (Default value seems off...)
+SHIFT_VERTICAL = 1    # QStyle.PM_ButtonShiftVertical
+                      # (Default value seems off...)
+
+TEXT_ICON_SPACING = 10  # Space between text and icon, if both present
+MARGIN = 10  # Horizontal space around the contents
+TRIM = 30  # Num picked to be > outer rad. of any button curve
+
+
+SegmentMetrics = collections.namedtuple("SegmentMetrics", (
+        "base_width", "base_height", "text_width", "text_height",
+        "icon_width", "icon_height", "has_text", "has_icon"))
+
+# In the segment's own coordinates, except rect (in the control's):
+#  * trimmed_rect - the rect to draw the button shape/bg in
+#  * text_rect    - the rect to draw the text in (left-aligned)
+#  * icon_pos     - top-left of the icon
+#  * divider      - (x, top, bottom) of the divider line, or None
+SegmentGeometry = collections.namedtuple("SegmentGeometry", (
+        "lrc_position", "rect", "trimmed_rect", "text_rect", "icon_pos",
+        "divider"))
+
+
+def _isAqua(is_flat, platform):
+    # Mac Aqua (non-flat) widgets need some adjustments...
+    # **NOTE**: may need to be further adjusted for Lion...
+    return not is_flat and platform == 'darwin'
+
+
+def lrcPosition(button_index, num_segments):
+    if (num_segments == 1 or 0 < button_index < num_segments - 1):
+        return POS_CENTRAL
+    elif (button_index == 0):
+        return POS_LEFTMOST
+    return POS_RIGHTMOST
+
+
+def interSegmentSpacing(is_flat, platform=sys.platform):
+    # Handle a Mac-related inconsistency
+    if (platform == 'darwin' and not is_flat):
+        return 12  # True for Aqua theme up to OSX Snow Leopard.
+                   # (OSX Lion and beyond? Unclear...)
+    else:
+        return 0  # Where does this come from?
+
+
+def separatorInsets(is_flat, platform=sys.platform):
+    # Return the (top, bottom) insets of the divider
+    # Handle a Mac-related inconsistency
+    if (platform == 'darwin'):
+        if (not is_flat):
+            return (4, 7)  # True for OSX Aqua thru Snow Leopard... Lion+ ?
+        else:
+            return (1, 1)
+    else:
+        return (1, 1)  # Where does this come from?
+
+
+def sizeHintExtraWidth(trim, margin, has_text, has_icon, is_flat,
+                       platform=sys.platform):
+    # Return the width to add to a push button's size hint
+    extra_width = 2*margin - trim  # Is this right?
+
+    # If button has an icon AND text, accomodate some spacing between them
+    if (has_text and has_icon):
+        extra_width += TEXT_ICON_SPACING
+
+    # If we're using Mac Aqua (non-flat) widgets, adjust...
+    # **NOTE**: may need to be further adjusted for Mac OS Lion...
+    if (_isAqua(is_flat, platform)):
+        extra_width += 20  # This right?
+
+    return extra_width
+
+
+def trimmedRect(width, height, lrc_position, trim):
+    # Return the segment's rect, extended past the side(s) to be trimmed
+    # If left-most segment...
+    if (lrc_position == POS_LEFTMOST):
+        return (0, 0, width + trim, height)  # clip right-most pixels
+    # If right-most segment...
+    elif (lrc_position == POS_RIGHTMOST):
+        return (-trim, 0, width + trim, height)  # clip left-most pixels
+    else:  # a center segment; clip right and left-most pixels
+        return (-trim//2, 0, width + trim//2 - (-trim//2), height)
+
+
+def contentOffsets(lrc_position, trim, margin, trimmed_width, trimmed_height,
+                   text_width, text_height, icon_width, icon_height,
+                   has_text, has_icon, is_flat, is_shifted,
+                   platform=sys.platform):
+    # Return (text_x, text_y, icon_x, icon_y). The text offset is relative
+    # to the trimmed rect, the icon offset to the segment. is_shifted:
+    # enabled and down
+    button_contents_width = trimmed_width - trim - (2 * margin)
+    button_contents_height = trimmed_height
+
+    text_offset_x = 0
+    text_offset_y = button_contents_height//2 - text_height//2
+    icon_offset_x = 0
+    icon_offset_y = button_contents_height//2 - icon_height//2
+
+    is_aqua = _isAqua(is_flat, platform)
+    if (is_aqua):
+        text_offset_y -= 3
+        icon_offset_y -= 2
+        if (lrc_position == POS_LEFTMOST):
+            text_offset_x += 6
+            icon_offset_x += 6
+        elif (lrc_position == POS_RIGHTMOST):
+            text_offset_x -= 6
+            icon_offset_x -= 6
+
+    # If the button is de-pressed, and we're not using Mac Aqua (non-Flat)
+    if (is_shifted and not is_aqua):
+        text_offset_x += SHIFT_HORIZONTAL
+        text_offset_y += SHIFT_VERTICAL
+        icon_offset_x += SHIFT_HORIZONTAL
+        icon_offset_y += SHIFT_VERTICAL
+
+    # Compensate for the trimmed rect extending left of the segment
+    if (lrc_position == POS_LEFTMOST):
+        trim_shift = 0
+    elif (lrc_position == POS_RIGHTMOST):
+        trim_shift = trim
+    else:  # A central button...
+        trim_shift = trim // 2
+
+    # If there's text only
+    if (has_text and not has_icon):
+        text_offset_x += margin + \
+                (button_contents_width // 2) - (text_width // 2) + trim_shift
+
+    # If there's an icon only
+    elif (not has_text and has_icon):
+        icon_offset_x += margin + button_contents_width//2 - icon_width//2
+
+    # If there's text and an icon; centre them together
+    elif (has_text and has_icon):
+        contents_left = margin + (button_contents_width // 2) - \
+            (icon_width + TEXT_ICON_SPACING + text_width) // 2
+        text_offset_x += TEXT_ICON_SPACING + icon_width + trim_shift + \
+            contents_left
+        icon_offset_x += contents_left
+
+    return (text_offset_x, text_offset_y, icon_offset_x, icon_offset_y)
+
+
+def dividerX(trimmed_left, lrc_position, trim, is_flat, platform=sys.platform):
+    # Return the x of the divider drawn at the segment's left edge, or None
+    # if there is none (left-most segment, or no button outlines drawn)
+    if (is_flat and platform != 'darwin'):
+        return None
+    if (lrc_position == POS_RIGHTMOST):
+        return trimmed_left + trim
+    elif (lrc_position == POS_CENTRAL):
+        return trimmed_left + trim//2
+    return None
+
+
+def segmentContent(lrc_position, width, height, text_width, text_height,
+                   icon_width, icon_height, has_text, has_icon, is_flat,
+                   is_shifted, trim=TRIM, margin=MARGIN, platform=sys.platform):
+    # Return (trimmed_rect, text_rect, icon_pos, divider) for a segment of
+    # the given size; see SegmentGeometry
+    trimmed_rect = trimmedRect(width, height, lrc_position, trim)
+    (text_x, text_y, icon_x, icon_y) = contentOffsets(
+            lrc_position, trim, margin, trimmed_rect[2], trimmed_rect[3],
+            text_width, text_height, icon_width, icon_height,
+            has_text, has_icon, is_flat, is_shifted, platform)
+    text_rect = (trimmed_rect[0] + text_x, trimmed_rect[1] + text_y,
+                 trimmed_rect[2], trimmed_rect[3])
+
+    divider = None
+    divider_x = dividerX(trimmed_rect[0], lrc_position, trim, is_flat, platform)
+    if (divider_x is not None):
+        top_inset, bottom_inset = separatorInsets(is_flat, platform)
+        divider = (divider_x, trimmed_rect[1] + top_inset,
+                   trimmed_rect[1] + trimmed_rect[3] - 1 - bottom_inset)
+
+    return (trimmed_rect, text_rect, (icon_x, icon_y), divider)
+
+
+def segmentWidth(metrics, is_flat, trim=TRIM, margin=MARGIN,
+                 platform=sys.platform):
+    return metrics.base_width + sizeHintExtraWidth(
+            trim, margin, metrics.has_text, metrics.has_icon, is_flat, platform)
+
+
+def layoutSegments(segments_metrics, is_flat=False, trim=TRIM, margin=MARGIN,
+                   platform=sys.platform):
+    """Lay out one control's segments at their size hints; return a list of
+    SegmentGeometry, in segment order."""
+    num_segments = len(segments_metrics)
+    spacing = interSegmentSpacing(is_flat, platform)
+    height = max([m.base_height for m in segments_metrics] or [0])
+
+    geometries = []
+    x = 0
+    for button_index, metrics in enumerate(segments_metrics):
+        width = segmentWidth(metrics, is_flat, trim, margin, platform)
+        lrc_position = lrcPosition(button_index, num_segments)
+        content = segmentContent(
+                lrc_position, width, height,
+                metrics.text_width, metrics.text_height,
+                metrics.icon_width, metrics.icon_height,
+                metrics.has_text, metrics.has_icon, is_flat, False,
+                trim, margin, platform)
+        geometries.append(SegmentGeometry(lrc_position, (x, 0, width, height),
+                                          *content))
+        x += width + spacing
+    return geometries
+
+
+def layoutControls(controls_metrics, is_flat=False, trim=TRIM, margin=MARGIN,
+                   platform=sys.platform, as_arrays=False, use_numpy=False):
+    """Lay out many controls at once: controls_metrics is a list (one per
+    control) of lists of SegmentMetrics. Returns a list (one per control)
+    of lists of SegmentGeometry.
+
+    With as_arrays, the layout is vectorized with NumPy (which must be
+    installed) and returned as a dict of per-segment arrays - see
+    _layoutControlsNumpy - skipping the per-segment tuples, which cost more
+    to build than the layout itself. use_numpy vectorizes, but still
+    returns SegmentGeometry."""
+    if (not as_arrays and not use_numpy):
+        return [layoutSegments(m, is_flat, trim, margin, platform)
+                for m in controls_metrics]
+
+    arrays = _layoutControlsNumpy(controls_metrics, is_flat, trim, margin,
+                                  platform)
+    if (as_arrays):
+        return arrays
+    return _geometriesFromArrays(arrays, [len(m) for m in controls_metrics])
+
+
+def _layoutControlsNumpy(controls_metrics, is_flat, trim, margin, platform):
+    # Vectorized layoutSegments over every segment of every control; any
+    # change to the rules above must be mirrored here (parity is checked by
+    # Benchmarks/bench_geometry_layout.py).
+    # Returns a dict of arrays, one element per segment (controls'
+    # segments concatenated), plus "control_starts", the index of each
+    # control's first segment.
+    import numpy as np
+
+    counts = np.array([len(m) for m in controls_metrics], dtype=np.int64)
+    flat = [metrics for m in controls_metrics for metrics in m]
+    if (not flat):
+        values = np.zeros((0, 8), dtype=np.int64)
+    else:
+        values = np.array(flat, dtype=np.int64).reshape(len(flat), 8)
+    (base_width, base_height, text_width, text_height,
+     icon_width, icon_height) = values[:, :6].T
+    has_text = values[:, 6].astype(bool)
+    has_icon = values[:, 7].astype(bool)
+
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+    control_of = np.repeat(np.arange(len(counts)), counts)
+    index = np.arange(len(flat)) - starts[control_of]
+    count = counts[control_of]
+    is_aqua = _isAqua(is_flat, platform)
+
+    # Positions
+    lrc = np.where((count == 1) | ((index > 0) & (index < count - 1)),
+                   POS_CENTRAL,
+                   np.where(index == 0, POS_LEFTMOST, POS_RIGHTMOST))
+    is_left = (lrc == POS_LEFTMOST)
+    is_right = (lrc == POS_RIGHTMOST)
+
+    # Widths, heights (per control maximum) and x positions
+    width = base_width + 2*margin - trim + \
+        TEXT_ICON_SPACING * (has_text & has_icon) + (20 if is_aqua else 0)
+    nonempty = counts > 0
+    control_height = np.zeros(len(counts), dtype=np.int64)
+    if (nonempty.any()):
+        control_height[nonempty] = np.maximum.reduceat(base_height,
+                                                       starts[nonempty])
+    height = control_height[control_of]
+    step = width + interSegmentSpacing(is_flat, platform)
+    x = np.cumsum(step) - step
+    x -= x[starts[control_of]] if len(flat) else 0
+
+    # Trimmed rect
+    trimmed_x = np.where(is_left, 0, np.where(is_right, -trim, -trim//2))
+    trimmed_width = width - trimmed_x + \
+        np.where(is_left, trim, np.where(is_right, 0, trim//2))
+
+    # Content offsets (as contentOffsets)
+    contents_width = trimmed_width - trim - 2*margin
+    text_x = np.zeros(len(flat), dtype=np.int64)
+    icon_x = np.zeros(len(flat), dtype=np.int64)
+    text_y = height//2 - text_height//2
+    icon_y = height//2 - icon_height//2
+    if (is_aqua):
+        text_y -= 3
+        icon_y -= 2
+        aqua_shift = np.where(is_left, 6, np.where(is_right, -6, 0))
+        text_x += aqua_shift
+        icon_x += aqua_shift
+    trim_shift = np.where(is_left, 0, np.where(is_right, trim, trim//2))
+    text_only = has_text & ~has_icon
+    icon_only = ~has_text & has_icon
+    both = has_text & has_icon
+    contents_left = margin + contents_width//2 - \
+        (icon_width + TEXT_ICON_SPACING + text_width)//2
+    text_x += np.where(text_only,
+                       margin + contents_width//2 - text_width//2 + trim_shift,
+                       0)
+    text_x += np.where(both, TEXT_ICON_SPACING + icon_width + trim_shift +
+                       contents_left, 0)
+    icon_x += np.where(icon_only, margin + contents_width//2 - icon_width//2, 0)
+    icon_x += np.where(both, contents_left, 0)
+
+    # Dividers
+    has_divider = ~is_left & (not is_flat or platform == 'darwin')
+    divider_x = trimmed_x + np.where(is_right, trim, trim//2)
+    top_inset, bottom_inset = separatorInsets(is_flat, platform)
+
+    return {
+        "control_starts": starts,
+        "lrc_position": lrc,
+        "x": x, "width": width, "height": height,
+        "trimmed_x": trimmed_x, "trimmed_width": trimmed_width,
+        "text_x": trimmed_x + text_x, "text_y": text_y,
+        "icon_x": icon_x, "icon_y": icon_y,
+        "has_divider": has_divider, "divider_x": divider_x,
+        "divider_top": np.full(len(flat), top_inset, dtype=np.int64),
+        "divider_bottom": height - 1 - bottom_inset,
+    }
+
+
+def _geometriesFromArrays(arrays, counts):
+    columns = [arrays[name].tolist() for name in (
+            "lrc_position", "x", "width", "height", "trimmed_x",
+            "trimmed_width", "text_x", "text_y", "icon_x", "icon_y",
+            "has_divider", "divider_x", "divider_top", "divider_bottom")]
+    geometries = [
+        SegmentGeometry(lrc_position, (x, 0, width, height),
+                        (trimmed_x, 0, trimmed_width, height),
+                        (text_x, text_y, trimmed_width, height),
+                        (icon_x, icon_y),
+                        (divider_x, divider_top, divider_bottom)
+                        if has_divider else None)
+        for (lrc_position, x, width, height, trimmed_x, trimmed_width,
+             text_x, text_y, icon_x, icon_y, has_divider, divider_x,
+             divider_top, divider_bottom) in zip(*columns)]
+
+    # Split back into controls
+    per_control = []
+    start = 0
+    for count in counts:
+        per_control.append(geometries[start:start + count])
+        start += count
+    return per_control
@@ -0,0 +1,432 @@
+# SegmentedControlItem class
+#
+# A QGraphicsObject counterpart of SegmentedControl, for scenes holding many
+# controls (embedding SegmentedControl widgets through QGraphicsProxyWidget
+# costs a widget, a layout and a proxy per control, and a widget per
+# segment).
+#
+# The item draws its segments itself, using the same segment geometry,
+# trimming and divider rules as SegmentButton (see geometry.py), hit-tests
+# segments itself, and is cached in device
+# coordinates (QGraphicsItem.DeviceCoordinateCache), so that an unchanged
+# item is blitted from its cache rather than re-painted. Only the segments
+# intersecting the exposed area are painted.
+#
+# The item supports the ButtonID-based and key-based signals of
+# SegmentedControl (there are no segment buttons to pass to button-based
+# signals):
+#  * buttonIdClicked
+#  * buttonIdPressed
+#  * buttonIdReleased
+#  * keyClicked
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+import bisect
+
+from . import geometry
+from . import palettecache
+from . import qtcompat as qt
+from .qtcompat import QtCore, QtGui, QtWidgets
+
+
+class _Segment(object):
+
+    __slots__ = ("text", "icon", "icon_size", "key", "checked", "metrics")
+
+    def __init__(self, text, icon, icon_size, key):
+        self.text = text
+        self.icon = icon
+        self.icon_size = icon_size
+        self.key = key
+        self.checked = False
+        self.metrics = None  # geometry.SegmentMetrics
+
+
+class SegmentedControlItem(QtWidgets.QGraphicsObject):
+
+    # Signals
+
+    # ButtonID-based
+    buttonIdClicked = qt.Signal(int)
+    buttonIdPressed = qt.Signal(int)
+    buttonIdReleased = qt.Signal(int)
+
+    # Key-based (segments with a key only)
+    keyClicked = qt.Signal(object)
+
+
+    def __init__(self, is_exclusive=True, parent=None):
+
+        # Init the base class
+        QtWidgets.QGraphicsObject.__init__(self, parent)
+
+        # Init class instance variables
+        self.trim_off = geometry.TRIM  # As SegmentedControl.trim_off
+        self.__is_flat = False
+        self.__is_exclusive = is_exclusive
+        self.__font = QtGui.QFont(QtWidgets.QApplication.font())
+        self.__palette = QtGui.QPalette(QtWidgets.QApplication.palette())
+        self.__pens = None
+
+        # Segments, and their geometry: the x of each segment's left edge,
+        # and the (common) height of the segments
+        self.__segments = []
+        self.__geometries = []  # geometry.SegmentGeometry, per segment
+        self.__lefts = []  # Segment lefts, for hit-testing
+        self.__height = 0
+
+        self.__key_index = {}  # Segment key -> segment index
+        self.__pressed_index = None  # Segment the mouse was pressed on
+        self.__is_down = False  # Mouse still over the pressed segment?
+
+        self.setAcceptedMouseButtons(
+                qt.enum(QtCore.Qt, "MouseButton", "LeftButton"))
+        self.setFlag(qt.enum(QtWidgets.QGraphicsItem, "GraphicsItemFlag",
+                             "ItemUsesExtendedStyleOption"))
+        self.setCacheMode(qt.enum(QtWidgets.QGraphicsItem, "CacheMode",
+                                  "DeviceCoordinateCache"))
+
+
+    def AppendSegmentButton(self, sb_text_str, sb_icon_path="",
+                            sb_icon_size=QtCore.QSize(), key=None):
+        return self.InsertSegmentButton(len(self.__segments), sb_text_str,
+                                        sb_icon_path, sb_icon_size, key)
+
+    def InsertSegmentButton(self, button_index, sb_text_str, sb_icon_path="",
+                            sb_icon_size=QtCore.QSize(), key=None):
+
+        # Clamp the index to the list
+        button_index = max(0, min(button_index, len(self.__segments)))
+
+        if (key is not None and key in self.__key_index):
+            raise ValueError("Duplicate segment key: %r" % (key,))
+
+        icon = QtGui.QIcon(sb_icon_path) if sb_icon_path else QtGui.QIcon()
+        segment = _Segment(sb_text_str, icon, QtCore.QSize(sb_icon_size), key)
+        segment.metrics = self.__segmentMetrics(segment)
+
+        self.__segments.insert(button_index, segment)
+        self.__renumberFrom(button_index)
+        if (self.__pressed_index is not None and
+                self.__pressed_index >= button_index):
+            self.__pressed_index += 1
+
+        self.__updateGeometry()
+        return button_index
+
+    def RemoveSegmentButton(self, button_index):
+        if (not 0 <= button_index < len(self.__segments)):  # Ignore bad
+            return                                          # indexes
+
+        segment = self.__segments.pop(button_index)
+        if (segment.key is not None):
+            del self.__key_index[segment.key]
+        self.__renumberFrom(button_index)
+        if (self.__pressed_index == button_index):
+            self.__pressed_index = None
+            self.__is_down = False
+        elif (self.__pressed_index is not None and
+                self.__pressed_index > button_index):
+            self.__pressed_index -= 1
+
+        self.__updateGeometry()
+
+    def count(self):
+        return len(self.__segments)
+
+
+    def setFlat(self, flat):
+        self.__is_flat = flat
+        for segment in self.__segments:
+            segment.metrics = self.__segmentMetrics(segment)
+        self.__updateGeometry()
+
+    def isFlat(self):
+        return self.__is_flat
+
+
+    def setExclusive(self, is_exclusive):
+        self.__is_exclusive = is_exclusive
+    def isExclusive(self):
+        return self.__is_exclusive
+
+
+    def setFont(self, font):
+        self.__font = QtGui.QFont(font)
+        for segment in self.__segments:
+            segment.metrics = self.__segmentMetrics(segment)
+        self.__updateGeometry()
+    def font(self):
+        return QtGui.QFont(self.__font)
+
+    def setPalette(self, palette):
+        self.__palette = QtGui.QPalette(palette)
+        self.__pens = None
+        self.update()
+    def palette(self):
+        return QtGui.QPalette(self.__palette)
+
+
+    def getControlState(self):  # Return as a list - in segment order - of
+                                # true/false values
+        return [segment.checked for segment in self.__segments]
+
+    def getButtonState(self, button_index):
+        if (button_index < len(self.__segments)):
+            return self.__segments[button_index].checked
+
+    def setButtonState(self, button_index, state):
+        if (button_index < len(self.__segments)):
+            self.__setChecked(button_index, state)
+
+
+    def indexForKey(self, key):  # Return the segment index, or None
+        return self.__key_index.get(key)
+
+    def setCurrentKey(self, key):  # Check the segment with the given key
+                                   # (without emitting click signals)
+        button_index = self.__key_index.get(key)
+        if (button_index is not None):
+            self.__setChecked(button_index, True)
+
+    def currentKey(self):  # Key of the (first) checked segment, or None
+        for segment in self.__segments:
+            if (segment.checked):
+                return segment.key
+        return None
+
+
+    def segmentAt(self, pos):  # Return the index of the segment under pos
+                               # (item coordinates), or None
+        x = pos.x()
+        button_index = bisect.bisect_right(self.__lefts, x) - 1
+        if (button_index < 0 or pos.y() < 0 or pos.y() >= self.__height):
+            return None
+        (left, _, width, _) = self.__geometries[button_index].rect
+        if (x >= left + width):
+            return None  # In the space between segments
+        return button_index
+
+    def segmentRect(self, button_index):
+        return QtCore.QRect(*self.__geometries[button_index].rect)
+
+
+    # QGraphicsItem
+
+    def boundingRect(self):
+        if (not self.__segments):
+            return QtCore.QRectF()
+        (left, _, width, _) = self.__geometries[-1].rect
+        right = left + width
+        return QtCore.QRectF(0, 0, right, self.__height)
+
+    def paint(self, painter, option, widget=None):
+        if (not self.__segments):
+            return
+        style = widget.style() if widget is not None else \
+            QtWidgets.QApplication.style()
+        if (self.__pens is None):
+            self.__pens = palettecache.pensFor(self.__palette)
+
+        # Only paint segments that intersect the exposed area
+        exposed = option.exposedRect
+        first = max(0, bisect.bisect_right(self.__lefts, exposed.left()) - 1)
+        last = bisect.bisect_left(self.__lefts, exposed.right())
+        painter.setFont(self.__font)
+        for button_index in range(first, min(last, len(self.__segments))):
+            self.__paintSegment(painter, style, widget, button_index)
+
+    def mousePressEvent(self, event):
+        button_index = self.segmentAt(event.pos())
+        if (button_index is None or not self.isEnabled()):
+            event.ignore()
+            return
+        self.__pressed_index = button_index
+        self.__is_down = True
+        self.update(QtCore.QRectF(self.segmentRect(button_index)))
+        self.buttonIdPressed.emit(button_index)
+
+    def mouseMoveEvent(self, event):
+        if (self.__pressed_index is None):
+            return
+        is_down = (self.segmentAt(event.pos()) == self.__pressed_index)
+        if (is_down != self.__is_down):
+            self.__is_down = is_down
+            self.update(QtCore.QRectF(self.segmentRect(self.__pressed_index)))
+
+    def mouseReleaseEvent(self, event):
+        button_index = self.__pressed_index
+        if (button_index is None):
+            return
+        self.__pressed_index = None
+        self.__is_down = False
+        self.update(QtCore.QRectF(self.segmentRect(button_index)))
+        self.buttonIdReleased.emit(button_index)
+        if (self.segmentAt(event.pos()) == button_index):
+            self.__click(button_index)
+
+
+    # Internals
+
+    def __click(self, button_index):
+        segment = self.__segments[button_index]
+        if (self.__is_exclusive):
+            self.__setChecked(button_index, True)
+        else:
+            self.__setChecked(button_index, not segment.checked)
+        self.buttonIdClicked.emit(button_index)
+        if (segment.key is not None):
+            self.keyClicked.emit(segment.key)
+
+    def __setChecked(self, button_index, checked):
+        # As QButtonGroup: an exclusive item's checked segment can only be
+        # unchecked by checking another
+        if (not checked and self.__is_exclusive):
+            return
+        if (checked and self.__is_exclusive):
+            for other_index, other in enumerate(self.__segments):
+                if (other.checked and other_index != button_index):
+                    other.checked = False
+                    self.update(QtCore.QRectF(self.segmentRect(other_index)))
+        segment = self.__segments[button_index]
+        if (segment.checked != checked):
+            segment.checked = checked
+            self.update(QtCore.QRectF(self.segmentRect(button_index)))
+
+    def __renumberFrom(self, button_index):  # Re-index the keys of the
+                                             # segments from button_index on
+        for following_index in range(button_index, len(self.__segments)):
+            key = self.__segments[following_index].key
+            if (key is not None):
+                self.__key_index[key] = following_index
+
+    def __updateGeometry(self):
+        self.prepareGeometryChange()
+        self.__geometries = geometry.layoutSegments(
+                [segment.metrics for segment in self.__segments],
+                self.__is_flat, self.trim_off, geometry.MARGIN)
+        self.__lefts = [g.rect[0] for g in self.__geometries]
+        self.__height = max([g.rect[3] for g in self.__geometries] or [0])
+        self.update()
+
+    def __styleOption(self, segment, rect, is_down, widget):
+        option = QtWidgets.QStyleOptionButton()
+        if (widget is not None):
+            option.initFrom(widget)
+        option.palette = self.__palette
+        option.fontMetrics = QtGui.QFontMetrics(self.__font)
+        option.rect = rect
+
+        # As QPushButton.initStyleOption
+        QStyle = QtWidgets.QStyle
+        state = qt.enum(QStyle, "StateFlag", "State_None")
+        if (self.isEnabled()):
+            state |= qt.enum(QStyle, "StateFlag", "State_Enabled")
+        if (is_down):
+            state |= qt.enum(QStyle, "StateFlag", "State_Sunken")
+        if (segment.checked):
+            state |= qt.enum(QStyle, "StateFlag", "State_On")
+        else:
+            state |= qt.enum(QStyle, "StateFlag", "State_Off")
+        if (not self.__is_flat and not is_down):
+            state |= qt.enum(QStyle, "StateFlag", "State_Raised")
+        option.state = state
+        if (self.__is_flat):
+            option.features = qt.enum(QtWidgets.QStyleOptionButton,
+                                      "ButtonFeature", "Flat")
+        return option
+
+    def __segmentMetrics(self, segment):
+        # Measure the segment for the geometry engine; the base size is as
+        # QPushButton.sizeHint
+        has_text = bool(segment.text)
+        has_icon = not segment.icon.isNull()
+        width = 0
+        height = 0
+        if (has_icon):
+            width += segment.icon_size.width() + 4
+            height = max(height, segment.icon_size.height())
+        text_size = QtGui.QFontMetrics(self.__font).size(
+                qt.enum(QtCore.Qt, "TextFlag", "TextShowMnemonic"),
+                segment.text if has_text else "XXXX")
+        if (has_text or not width):
+            width += text_size.width()
+        if (has_text or not height):
+            height = max(height, text_size.height())
+
+        option = self.__styleOption(segment, QtCore.QRect(0, 0, width, height),
+                                    False, None)
+        option.text = segment.text
+        option.icon = segment.icon
+        option.iconSize = segment.icon_size
+        size = QtWidgets.QApplication.style().sizeFromContents(
+                qt.enum(QtWidgets.QStyle, "ContentsType", "CT_PushButton"),
+                option, QtCore.QSize(width, height), None)
+        text_bounds = QtGui.QFontMetrics(self.__font).boundingRect(segment.text)
+        return geometry.SegmentMetrics(
+                size.width(), size.height(),
+                text_bounds.width(), text_bounds.height(),
+                segment.icon_size.width(), segment.icon_size.height(),
+                has_text, has_icon)
+
+    def __paintSegment(self, painter, style, widget, button_index):
+        segment = self.__segments[button_index]
+        segment_rect = self.segmentRect(button_index)
+        is_down = (self.__is_down and button_index == self.__pressed_index)
+        has_text = bool(segment.text)
+        has_icon = not segment.icon.isNull()
+
+        # Paint in segment coordinates, clipped to the segment, as a
+        # SegmentButton would be
+        painter.save()
+        painter.translate(segment_rect.left(), 0)
+        painter.setClipRect(QtCore.QRect(0, 0, segment_rect.width(),
+                                         segment_rect.height()))
+
+        # Button shape/bg - trimming side(s) if necessary - and text and/or
+        # icon, as laid out; shifted if the segment is down
+        segment_geometry = self.__geometries[button_index]
+        (trimmed_rect, text_rect, icon_pos, divider) = segment_geometry[2:]
+        if (is_down and self.isEnabled()):
+            metrics = segment.metrics
+            (trimmed_rect, text_rect, icon_pos, divider) = \
+                geometry.segmentContent(
+                    segment_geometry.lrc_position,
+                    segment_rect.width(), segment_rect.height(),
+                    metrics.text_width, metrics.text_height,
+                    metrics.icon_width, metrics.icon_height,
+                    has_text, has_icon, self.__is_flat, True,
+                    self.trim_off, geometry.MARGIN)
+
+        # Draw button shape/bg
+        option = self.__styleOption(segment, QtCore.QRect(*trimmed_rect),
+                                    is_down, widget)
+        style.drawControl(
+                qt.enum(QtWidgets.QStyle, "ControlElement", "CE_PushButton"),
+                option, painter, widget)
+
+        # Text and/or icon
+        if (has_text):
+            painter.setPen(self.__pens[(self.isEnabled(), segment.checked,
+                                        palettecache.TEXT)])
+            painter.drawText(QtCore.QRect(*text_rect),
+                             qt.enum(QtCore.Qt, "AlignmentFlag", "AlignLeft"),
+                             segment.text)
+        if (has_icon):
+            mode = qt.enum(QtGui.QIcon, "Mode",
+                           "Normal" if self.isEnabled() else "Disabled")
+            state = qt.enum(QtGui.QIcon, "State",
+                            "On" if segment.checked else "Off")
+            painter.drawPixmap(QtCore.QPoint(*icon_pos),
+                               segment.icon.pixmap(segment.icon_size, mode, state))
+
+        # Divider
+        if (divider is not None):
+            (divider_x, divider_top, divider_bottom) = divider
+            painter.setPen(self.__pens[(self.isEnabled(), segment.checked,
+                                        palettecache.DIVIDER)])
+            painter.drawLine(divider_x, divider_top, divider_x, divider_bottom)
+
+        painter.restore()
+# ------------------------------------------------------
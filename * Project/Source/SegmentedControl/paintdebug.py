@@ -0,0 +1,139 @@
+# Paint debugging for SegmentButtons
+#
+# Two visual aids for spotting over-painting:
+#
+#  * Paint flash - every SegmentButton.paintEvent briefly tints the area it
+#    repainted. Enabled for all controls, either by setting the environment
+#    variable SEGMENTED_CONTROL_PAINT_FLASH=1 before the package is first
+#    used, or with setPaintFlashEnabled(True).
+#
+#  * Paint heatmap - each segment of a control is tinted from blue (few
+#    paints) to red (most paints in that control) and labelled with its
+#    cumulative paint count. Enabled per control, with
+#    SegmentedControl.setPaintHeatmapVisible(True).
+#
+# When neither is in use, the only cost to a paint is testing the module
+# level "active" flag. Segment paint counts (SegmentButton.paint_count) are
+# only maintained while one of the aids is in use.
+
+
+import functools
+import os
+import weakref
+
+# Qt is only used (qt.QtCore/qt.QtGui) while painting, so importing this
+# module doesn't import a binding
+from . import qtcompat as qt
+
+
+ENV_VAR = "SEGMENTED_CONTROL_PAINT_FLASH"
+
+FLASH_DURATION_MS = 120
+FLASH_COLOR = (255, 0, 255, 110)  # Translucent magenta (RGBA)
+
+HEATMAP_ALPHA = 110
+
+_flash_enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+_heatmap_controls = {}  # id() of each control currently showing a heatmap
+                        # -> its destroyed signal slot
+
+# Checked by SegmentButton.paintEvent; True if any aid is in use
+active = _flash_enabled
+
+
+def _updateActive():
+    global active
+    active = _flash_enabled or bool(_heatmap_controls)
+
+
+def setPaintFlashEnabled(enabled):
+    global _flash_enabled
+    _flash_enabled = bool(enabled)
+    _updateActive()
+
+
+def isPaintFlashEnabled():
+    return _flash_enabled
+
+
+def _heatmapShown(control, shown):  # Called by
+                                   # SegmentedControl.setPaintHeatmapVisible
+    # A control destroyed while showing its heatmap no longer counts
+    key = id(control)
+    if (shown):
+        slot = functools.partial(_heatmapDestroyed, key)
+        _heatmap_controls[key] = slot
+        control.destroyed.connect(slot)
+    else:
+        slot = _heatmap_controls.pop(key, None)
+        if (slot is not None):
+            control.destroyed.disconnect(slot)
+    _updateActive()
+
+
+def _heatmapDestroyed(key, *args):
+    _heatmap_controls.pop(key, None)
+    _updateActive()
+
+
+def afterPaint(button, painter, event):
+    """Apply the enabled paint aids, once button has painted itself."""
+
+    # A repaint that only removes earlier flashes is not counted, nor
+    # flashed; but Qt may merge the clearing update with genuine ones, so
+    # anything painted outside the flashes being cleared still is
+    painted = event.region()
+    clear_region = button._paint_flash_clear_region
+    button._paint_flash_clear_region = None
+    if (clear_region is not None):
+        painted = painted.subtracted(clear_region)
+    counted = not painted.isEmpty()
+    control = button.control
+    if (counted):
+        button.paint_count += 1
+        if (control is not None and
+                button.paint_count > control._max_paint_count):
+            control._max_paint_count = button.paint_count
+
+    if (control is not None and control.isPaintHeatmapVisible()):
+        drawHeatmapCell(button, painter, control._max_paint_count)
+
+    if (_flash_enabled and counted):
+        painter.save()
+        painter.setClipRegion(painted)
+        painter.fillRect(painted.boundingRect(),
+                         qt.QtGui.QColor(*FLASH_COLOR))
+        painter.restore()
+        qt.QtCore.QTimer.singleShot(
+                FLASH_DURATION_MS,
+                functools.partial(_clearFlash, weakref.ref(button),
+                                  painted.boundingRect()))
+
+
+def drawHeatmapCell(button, painter, max_count):  # max_count: the most
+                                                 # paints of any segment
+    heat = float(button.paint_count) / max_count if max_count else 0.0
+
+    # Hue runs from blue (240, cold) to red (0, hot)
+    color = qt.QtGui.QColor.fromHsv(int(240 * (1.0 - heat)), 255, 255,
+                                 HEATMAP_ALPHA)
+    painter.fillRect(button.rect(), color)
+    painter.setPen(qt.QtGui.QColor(0, 0, 0))
+    painter.drawText(button.rect().adjusted(2, 0, 0, 0),
+                     qt.enum(qt.QtCore.Qt, "AlignmentFlag", "AlignLeft"),
+                     str(button.paint_count))
+
+
+def _clearFlash(button_ref, rect):
+    button = button_ref()
+    if (button is None):
+        return
+    try:
+        if (button._paint_flash_clear_region is None):
+            button._paint_flash_clear_region = qt.QtGui.QRegion(rect)
+        else:
+            button._paint_flash_clear_region = \
+                    button._paint_flash_clear_region.united(rect)
+        button.update(rect)
+    except RuntimeError:  # Underlying C++ widget already deleted
+        pass
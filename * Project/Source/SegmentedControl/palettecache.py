@@ -0,0 +1,69 @@
+# Palette-derived pens for SegmentButtons, shared across all controls
+#
+# SegmentButton paints its text and inter-segment divider with pens derived
+# from its palette, for each (enabled, checked, role) combination. Those
+# pens are computed once per palette (keyed by QPalette.cacheKey(), so that
+# every button sharing a palette shares the pens), and looked up, not
+# allocated, while painting.
+#
+# Buttons drop their reference to the pens on PaletteChange/StyleChange,
+# which also clears this cache (see SegmentButton.changeEvent).
+
+
+from . import qtcompat as qt
+from .qtcompat import QtCore, QtGui
+
+
+# Roles
+TEXT = 0
+DIVIDER = 1
+
+# Alpha multipliers, applied on top of the palette's own colors
+UNCHECKED_TEXT_ALPHA = 0.90
+DISABLED_DIVIDER_ALPHA = 0.80
+
+_MAX_PALETTES = 64  # Cache is cleared beyond this many distinct palettes
+
+_cache = {}  # QPalette.cacheKey() -> {(enabled, checked, role): QPen}
+
+
+def pensFor(palette):
+    """Return the {(enabled, checked, role): QPen} dict for palette."""
+    palette_key = palette.cacheKey()
+    pens = _cache.get(palette_key)
+    if (pens is None):
+        if (len(_cache) >= _MAX_PALETTES):
+            _cache.clear()
+        pens = _derivePens(palette)
+        _cache[palette_key] = pens
+    return pens
+
+
+def invalidate():
+    _cache.clear()
+
+
+def _derivePens(palette):
+    active = qt.enum(QtGui.QPalette, "ColorGroup", "Active")
+    disabled = qt.enum(QtGui.QPalette, "ColorGroup", "Disabled")
+    button_text = qt.enum(QtGui.QPalette, "ColorRole", "ButtonText")
+    dark = qt.enum(QtGui.QPalette, "ColorRole", "Dark")
+    solid_line = qt.enum(QtCore.Qt, "PenStyle", "SolidLine")
+
+    pens = {}
+    for enabled in (True, False):
+        group = active if enabled else disabled
+        for checked in (True, False):
+
+            text_color = QtGui.QColor(palette.color(group, button_text))
+            if (not checked):
+                text_color.setAlphaF(text_color.alphaF() * UNCHECKED_TEXT_ALPHA)
+            pens[(enabled, checked, TEXT)] = QtGui.QPen(text_color)
+
+            divider_color = QtGui.QColor(palette.color(group, dark))
+            if (not enabled):
+                divider_color.setAlphaF(
+                        divider_color.alphaF() * DISABLED_DIVIDER_ALPHA)
+            pens[(enabled, checked, DIVIDER)] = QtGui.QPen(divider_color, 1,
+                                                           solid_line)
+    return pens
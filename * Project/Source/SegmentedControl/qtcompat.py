@@ -0,0 +1,116 @@
+# Qt binding resolution for the SegmentedControl package
+#
+# The binding (PyQt5, PyQt6, PySide6, PySide2, PyQt4 or PySide) is chosen
+# lazily, the first time one of this module's attributes is used, so that
+# importing the package costs nothing. QtGui and QtWidgets are only imported
+# once something actually asks for them (i.e. when a control is created).
+#
+# Selection order:
+#  * The binding named by the QT_API environment variable, if set
+#    (e.g. QT_API=pyside6)
+#  * Any supported binding the application has already imported
+#  * The first supported binding that can be imported, in _BINDINGS order
+#
+# Usage:
+#
+#   from SegmentedControl import qtcompat as qt
+#   button = qt.QtWidgets.QPushButton()
+#   button.setFocusPolicy(qt.enum(qt.QtCore.Qt, "FocusPolicy", "NoFocus"))
+
+
+import importlib
+import os
+import sys
+
+
+_BINDINGS = ("PyQt5", "PyQt6", "PySide6", "PySide2", "PyQt4", "PySide")
+
+# Bindings that predate the QtGui/QtWidgets split; widgets live in QtGui
+_QT4_BINDINGS = ("PyQt4", "PySide")
+
+_binding = None  # Name of the resolved binding, once resolved
+_modules = {}    # Qt sub-module name -> imported sub-module
+
+
+def _resolveBinding():
+    global _binding
+    if (_binding is not None):
+        return _binding
+
+    # Requested explicitly?
+    requested = os.environ.get("QT_API", "").lower()
+    candidates = [b for b in _BINDINGS if b.lower() == requested]
+    if (requested and not candidates):
+        raise ImportError("QT_API=%s is not one of: %s" %
+                          (requested, ", ".join(_BINDINGS)))
+
+    # Otherwise, prefer whatever the application already uses
+    if (not candidates):
+        candidates = [b for b in _BINDINGS if b in sys.modules]
+        candidates += [b for b in _BINDINGS if b not in candidates]
+
+    for name in candidates:
+        try:
+            importlib.import_module(name + ".QtCore")
+        except ImportError:
+            continue
+        _binding = name
+        return _binding
+
+    raise ImportError("No Qt binding found (tried: %s)" %
+                      ", ".join(candidates))
+
+
+def _importQtModule(module_name):
+    module = _modules.get(module_name)
+    if (module is None):
+        binding = bindingName()
+        if (module_name == "QtWidgets" and binding in _QT4_BINDINGS):
+            module = _importQtModule("QtGui")
+        else:
+            module = importlib.import_module(binding + "." + module_name)
+        _modules[module_name] = module
+    return module
+
+
+def bindingName():
+    """Return the name of the Qt binding in use, resolving it if needed."""
+    return _resolveBinding()
+
+
+def isQt6():
+    return bindingName() in ("PyQt6", "PySide6")
+
+
+def enum(owner, scope, name):
+    """Return owner.scope.name where the binding scopes its enums (Qt6),
+    falling back to the unscoped owner.name (Qt4/Qt5)."""
+    try:
+        return getattr(getattr(owner, scope), name)
+    except AttributeError:
+        return getattr(owner, name)
+
+
+def overload(signal, *types):
+    """Select a signal overload by argument types, where the binding has
+    overloads for it; otherwise return the signal itself."""
+    try:
+        return signal[types if len(types) > 1 else types[0]]
+    except (KeyError, IndexError, TypeError):
+        return signal
+
+
+def execApplication(app):
+    """Run app's event loop (exec_ in older bindings, exec in Qt6)."""
+    run = getattr(app, "exec_", None) or getattr(app, "exec")
+    return run()
+
+
+def __getattr__(attr):
+    # Lazily resolved module-level attributes
+    if (attr in ("QtCore", "QtGui", "QtWidgets", "QtTest")):
+        return _importQtModule(attr)
+    if (attr == "Signal"):
+        QtCore = _importQtModule("QtCore")
+        return getattr(QtCore, "pyqtSignal", None) or QtCore.Signal
+    raise AttributeError("module %r has no attribute %r" % (__name__, attr))
@@ -0,0 +1,174 @@
+# State snapshots for all the SegmentedControls under a widget
+#
+# A snapshot maps each control's objectName to (num_segments, bits), where
+# bit i of bits is set if segment i is checked (see getControlState).
+# Snapshots can be diffed cheaply (one integer comparison per control),
+# encoded to / decoded from a compact binary form, and restored, touching
+# only the controls - and within them, only the segments - that differ.
+#
+# Restoring uses setButtonState (i.e. setChecked), so no clicked/pressed/
+# released signals are emitted; buttons whose state changes still emit
+# toggled.
+#
+# Usage:
+#
+#   saved = snapshot.takeSnapshot(window)
+#   data = snapshot.encodeSnapshot(saved)  # bytes, e.g. to persist
+#   ...
+#   snapshot.restoreSnapshot(window, snapshot.decodeSnapshot(data))
+
+
+import struct
+
+
+_MAGIC = b"SCS1"
+_COUNT = struct.Struct(">I")  # Number of entries
+_ENTRY_HEADER = struct.Struct(">HH")  # Name length, number of segments
+_MAX_FIELD = 0xFFFF  # Longest name (bytes), most segments, per entry
+
+
+def controlsUnder(parent):
+    """Return {objectName: SegmentedControl} for parent and its descendants.
+    Controls without an objectName are skipped."""
+    from .control import SegmentedControl
+
+    controls = {}
+    candidates = parent.findChildren(SegmentedControl)
+    if (isinstance(parent, SegmentedControl)):
+        candidates.insert(0, parent)
+    for control in candidates:
+        name = control.objectName()
+        if (not name):
+            continue
+        if (name in controls):
+            raise ValueError("Duplicate SegmentedControl objectName: %r" % name)
+        controls[name] = control
+    return controls
+
+
+def stateBits(control):
+    bits = 0
+    for button_index, checked in enumerate(control.getControlState()):
+        if (checked):
+            bits |= 1 << button_index
+    return bits
+
+
+def takeSnapshot(parent):
+    return dict((name, (len(control.segment_buttons), stateBits(control)))
+                for name, control in controlsUnder(parent).items())
+
+
+def diffSnapshots(old, new):
+    """Return the entries of new that are absent from, or differ from, old."""
+    return dict((name, entry) for name, entry in new.items()
+                if old.get(name) != entry)
+
+
+def restoreSnapshot(parent, snapshot, current=None):
+    """Apply snapshot to the controls under parent, changing only segments
+    whose state differs. current, if given, is a snapshot known to match
+    the controls' present state (saves taking a fresh one). Returns the
+    names of the controls that changed."""
+    controls = controlsUnder(parent)
+    if (current is None):
+        current = dict((name, (len(control.segment_buttons),
+                               stateBits(control)))
+                       for name, control in controls.items()
+                       if name in snapshot)
+
+    changed = []
+    for name, entry in diffSnapshots(current, snapshot).items():
+        control = controls.get(name)
+        if (control is None):
+            continue
+        current_bits = current.get(name, (0, 0))[1]
+        if (_applyBits(control, current_bits, entry[1])):
+            changed.append(name)
+    return changed
+
+
+def _applyBits(control, current_bits, bits):
+    num_buttons = len(control.segment_buttons)
+    mask = (1 << num_buttons) - 1
+    bits &= mask
+    differing = (current_bits ^ bits) & mask
+    if (not differing):
+        return False
+
+    if (control.isExclusive() and bits):
+        # Checking one segment unchecks the others
+        control.setButtonState(_lowestSetBit(bits), True)
+    elif (control.isExclusive()):
+        # An exclusive group won't uncheck its checked button directly
+        control.setExclusive(False)
+        control.setButtonState(_lowestSetBit(current_bits & mask), False)
+        control.setExclusive(True)
+    else:
+        while (differing):
+            button_index = _lowestSetBit(differing)
+            control.setButtonState(button_index, bool(bits >> button_index & 1))
+            differing &= differing - 1
+    return True
+
+
+def _lowestSetBit(bits):
+    return (bits & -bits).bit_length() - 1
+
+
+def encodeSnapshot(snapshot):
+    """Raise ValueError if an entry can't be encoded: a name of over
+    _MAX_FIELD bytes (UTF-8), over _MAX_FIELD segments, or bits that don't
+    fit in num_segments."""
+    parts = [_MAGIC, _COUNT.pack(len(snapshot))]
+    for name, (num_segments, bits) in sorted(snapshot.items()):
+        name_bytes = name.encode("utf-8")
+        if (len(name_bytes) > _MAX_FIELD):
+            raise ValueError("SegmentedControl objectName too long to encode "
+                             "(%d bytes, at most %d): %r..." %
+                             (len(name_bytes), _MAX_FIELD, name[:40]))
+        if (not 0 <= num_segments <= _MAX_FIELD):
+            raise ValueError("Too many segments to encode for %r "
+                             "(%d, at most %d)" %
+                             (name, num_segments, _MAX_FIELD))
+        if (bits < 0 or bits.bit_length() > num_segments):
+            raise ValueError("State bits for %r don't fit its %d segments" %
+                             (name, num_segments))
+        parts.append(_ENTRY_HEADER.pack(len(name_bytes), num_segments))
+        parts.append(name_bytes)
+        parts.append(bits.to_bytes((num_segments + 7) // 8, "little"))
+    return b"".join(parts)
+
+
+def decodeSnapshot(data):
+    """Raise ValueError if data isn't a complete encoded snapshot."""
+    if (data[:len(_MAGIC)] != _MAGIC):
+        raise ValueError("Not an encoded SegmentedControl snapshot")
+    offset = len(_MAGIC)
+    _checkLength(data, offset + _COUNT.size)
+    (num_entries,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+
+    snapshot = {}
+    for _ in range(num_entries):
+        _checkLength(data, offset + _ENTRY_HEADER.size)
+        name_length, num_segments = _ENTRY_HEADER.unpack_from(data, offset)
+        offset += _ENTRY_HEADER.size
+        num_bytes = (num_segments + 7) // 8
+        _checkLength(data, offset + name_length + num_bytes)
+        name = data[offset:offset + name_length].decode("utf-8")
+        offset += name_length
+        bits = int.from_bytes(data[offset:offset + num_bytes], "little")
+        offset += num_bytes
+        snapshot[name] = (num_segments, bits)
+    if (offset != len(data)):
+        raise ValueError("Encoded SegmentedControl snapshot has %d trailing "
+                         "bytes" % (len(data) - offset))
+    return snapshot
+
+
+def _checkLength(data, needed):
+    if (len(data) < needed):
+        raise ValueError("Encoded SegmentedControl snapshot is truncated "
+                         "(%d bytes, expected at least %d)" %
+                         (len(data), needed))
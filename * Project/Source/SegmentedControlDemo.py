@@ -0,0 +1,417 @@
+# Segmented Control Demo
+#
+# Shows a window with a variety of SegmentedControls. Run from anywhere:
+#
+#   python SegmentedControlDemo.py
+
+
+import os
+import sys
+
+import SegmentedControl
+from SegmentedControl import qtcompat as qt
+
+
+IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          os.pardir, "Images")
+
+# The demo's segmented controls, one per row (set up in main())
+sc0 = sc1 = sc2 = sc3 = sc4 = sc5 = sc6 = None
+
+
+# Demo Code
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+# Callbacks
+# ++++++++++++++++
+
+# Button-based Callbacks
+
+# Clicked
+
+def firstRowClickedButton(button):
+    if (button.isEnabled()):
+        print("Clicked: First Row: ", sc0.segment_buttons[button.index].text())
+
+
+def secondRowClickedButton(button):
+    if (button.isEnabled()):
+        print("Clicked: Second Row: ", sc1.segment_buttons[button.index].text())
+
+
+def thirdRowClickedButton(button):
+    if (button.isEnabled()):
+        print("Clicked: Third Row, ", sc2.segment_buttons[button.index].text())
+
+
+def fourthRowClickedButton(button):
+    if (button.isEnabled()):
+        print("Clicked: Fourth Row, ", sc3.segment_buttons[button.index].text())
+
+
+def fifthRowClickedButton(button):
+    if (button.isEnabled()):
+        print("Clicked: Fifth Row, ", sc4.segment_buttons[button.index].text())
+
+
+def sixthRowClickedButton(button):
+    if (button.isEnabled()):
+        print("Clicked: Sixth Row, ", sc5.segment_buttons[button.index].text())
+
+
+def seventhRowClickedButton(button):
+    if (button.isEnabled()):
+        print("Clicked: Seventh Row, ", sc6.segment_buttons[button.index].text())
+
+
+# Pressed
+
+def firstRowPressedButton(button):
+    if (button.isEnabled()):
+        print("Pressed: First Row: ", sc0.segment_buttons[button.index].text())
+
+
+def secondRowPressedButton(button):
+    if (button.isEnabled()):
+        print("Pressed: Second Row: ", sc1.segment_buttons[button.index].text())
+
+
+def thirdRowPressedButton(button):
+    if (button.isEnabled()):
+        print("Pressed: Third Row, ", sc2.segment_buttons[button.index].text())
+
+
+def fourthRowPressedButton(button):
+    if (button.isEnabled()):
+        print("Pressed: Fourth Row, ", sc3.segment_buttons[button.index].text())
+
+
+def fifthRowPressedButton(button):
+    if (button.isEnabled()):
+        print("Pressed: Fifth Row, ", sc4.segment_buttons[button.index].text())
+
+
+def sixthRowPressedButton(button):
+    if (button.isEnabled()):
+        print("Pressed: Sixth Row, ", sc5.segment_buttons[button.index].text())
+
+
+def seventhRowPressedButton(button):
+    if (button.isEnabled()):
+        print("Pressed: Seventh Row, ", sc6.segment_buttons[button.index].text())
+
+
+# Released
+
+def firstRowReleasedButton(button):
+    if (button.isEnabled()):
+        print("Released: First Row: ", sc0.segment_buttons[button.index].text())
+
+
+def secondRowReleasedButton(button):
+    if (button.isEnabled()):
+        print("Released: Second Row: ", sc1.segment_buttons[button.index].text())
+
+
+def thirdRowReleasedButton(button):
+    if (button.isEnabled()):
+        print("Released: Third Row, ", sc2.segment_buttons[button.index].text())
+
+
+def fourthRowReleasedButton(button):
+    if (button.isEnabled()):
+        print("Released: Fourth Row, ", sc3.segment_buttons[button.index].text())
+
+
+def fifthRowReleasedButton(button):
+    if (button.isEnabled()):
+        print("Released: Fifth Row, ", sc4.segment_buttons[button.index].text())
+
+
+def sixthRowReleasedButton(button):
+    if (button.isEnabled()):
+        print("Released: Sixth Row, ", sc5.segment_buttons[button.index].text())
+
+
+def seventhRowReleasedButton(button):
+    if (button.isEnabled()):
+        print("Released: Seventh Row, ", sc6.segment_buttons[button.index].text())
+
+
+# ButtonID-based Callbacks
+
+# Clicked
+
+def firstRowClickedButtonId(button_id):
+    if (sc0.segment_buttons[button_id].isEnabled()):
+        print("Clicked: First Row, Button #", button_id)
+
+
+def secondRowClickedButtonId(button_id):
+    if (sc1.segment_buttons[button_id].isEnabled()):
+        print("Clicked: Second Row, Button #", button_id)
+
+
+def thirdRowClickedButtonId(button_id):
+    if (sc2.segment_buttons[button_id].isEnabled()):
+        print("Clicked: Third Row, Button #", button_id)
+
+
+def fourthRowClickedButtonId(button_id):
+    if (sc3.segment_buttons[button_id].isEnabled()):
+        print("Clicked: Fourth Row, Button #", button_id)
+
+
+def fifthRowClickedButtonId(button_id):
+    if (sc4.segment_buttons[button_id].isEnabled()):
+        print("Clicked: Fifth Row, Button #", button_id)
+
+
+def sixthRowClickedButtonId(button_id):
+    if (sc5.segment_buttons[button_id].isEnabled()):
+        print("Clicked: Sixth Row, Button #", button_id)
+
+
+def seventhRowClickedButtonId(button_id):
+    if (sc6.segment_buttons[button_id].isEnabled()):
+        print("Clicked: Seventh Row, Button #", button_id)
+
+
+# Pressed
+
+def firstRowPressedButtonId(button_id):
+    if (sc0.segment_buttons[button_id].isEnabled()):
+        print("Pressed: First Row, Button #", button_id)
+
+
+def secondRowPressedButtonId(button_id):
+    if (sc1.segment_buttons[button_id].isEnabled()):
+        print("Pressed: Second Row, Button #", button_id)
+
+
+def thirdRowPressedButtonId(button_id):
+    if (sc2.segment_buttons[button_id].isEnabled()):
+        print("Pressed: Third Row, Button #", button_id)
+
+
+def fourthRowPressedButtonId(button_id):
+    if (sc3.segment_buttons[button_id].isEnabled()):
+        print("Pressed: Fourth Row, Button #", button_id)
+
+
+def fifthRowPressedButtonId(button_id):
+    if (sc4.segment_buttons[button_id].isEnabled()):
+        print("Pressed: Fifth Row, Button #", button_id)
+
+
+def sixthRowPressedButtonId(button_id):
+    if (sc5.segment_buttons[button_id].isEnabled()):
+        print("Pressed: Sixth Row, Button #", button_id)
+
+
+def seventhRowPressedButtonId(button_id):
+    if (sc6.segment_buttons[button_id].isEnabled()):
+        print("Pressed: Seventh Row, Button #", button_id)
+
+
+# Released
+
+def firstRowReleasedButtonId(button_id):
+    if (sc0.segment_buttons[button_id].isEnabled()):
+        print("Released: First Row, Button #", button_id)
+
+
+def secondRowReleasedButtonId(button_id):
+    if (sc1.segment_buttons[button_id].isEnabled()):
+        print("Released: Second Row, Button #", button_id)
+
+
+def thirdRowReleasedButtonId(button_id):
+    if (sc2.segment_buttons[button_id].isEnabled()):
+        print("Released: Third Row, Button #", button_id)
+
+
+def fourthRowReleasedButtonId(button_id):
+    if (sc3.segment_buttons[button_id].isEnabled()):
+        print("Released: Fourth Row, Button #", button_id)
+
+
+def fifthRowReleasedButtonId(button_id):
+    if (sc4.segment_buttons[button_id].isEnabled()):
+        print("Released: Fifth Row, Button #", button_id)
+
+
+def sixthRowReleasedButtonId(button_id):
+    if (sc5.segment_buttons[button_id].isEnabled()):
+        print("Released: Sixth Row, Button #", button_id)
+
+
+def seventhRowReleasedButtonId(button_id):
+    if (sc6.segment_buttons[button_id].isEnabled()):
+        print("Released: Seventh Row, Button #", button_id)
+# ----------------
+
+
+def main():
+    global sc0, sc1, sc2, sc3, sc4, sc5, sc6
+
+    QtCore, QtWidgets = qt.QtCore, qt.QtWidgets
+
+    app = QtWidgets.QApplication(sys.argv)
+
+    widget = QtWidgets.QWidget()
+
+    vlayout = QtWidgets.QVBoxLayout(widget)
+    vlayout.setSpacing(5)
+    vlayout.setContentsMargins(10, 10, 10, 10)
+
+
+    # Set up the segmented controls
+    # ++++++++++++++++
+
+    ql0 = QtWidgets.QLabel(" \n1. Disabled, Two Buttons:")
+    sc0 = SegmentedControl.SegmentedControl()
+    sc0.AppendSegmentButton("No")
+    sc0.AppendSegmentButton("Yes")
+    sc0.setEnabled(False)
+
+    ql1 = QtWidgets.QLabel(" \n2. Enabled, Three Buttons:")
+    sc1 = SegmentedControl.SegmentedControl()
+    sc1.AppendSegmentButton("No")
+    sc1.AppendSegmentButton("Maybe")
+    sc1.AppendSegmentButton("Yes")
+
+    ql2 = QtWidgets.QLabel(" \n3. Enabled, NOT Mutually Exclusive:")
+    sc2 = SegmentedControl.SegmentedControl(False)
+    sc2.AppendSegmentButton("No")
+    sc2.AppendSegmentButton("Maybe")
+    sc2.AppendSegmentButton("Yes")
+
+    ql3 = QtWidgets.QLabel(" \n4. Text with Icon:")
+    sc3 = SegmentedControl.SegmentedControl()
+    sc3.AppendSegmentButton("No", os.path.join(IMAGES_DIR, "img20x20.png"), QtCore.QSize(12, 12))
+    sc3.AppendSegmentButton("Maybe", os.path.join(IMAGES_DIR, "img20x20.png"), QtCore.QSize(12, 12))
+    sc3.AppendSegmentButton("Yes", os.path.join(IMAGES_DIR, "img20x20.png"), QtCore.QSize(12, 12))
+
+    ql4 = QtWidgets.QLabel(" \n5. Icon Only:")
+    sc4 = SegmentedControl.SegmentedControl()
+    sc4.AppendSegmentButton("", os.path.join(IMAGES_DIR, "img20x20.png"), QtCore.QSize(14, 14))
+    sc4.AppendSegmentButton("", os.path.join(IMAGES_DIR, "img20x20.png"), QtCore.QSize(14, 14))
+    sc4.AppendSegmentButton("", os.path.join(IMAGES_DIR, "img20x20.png"), QtCore.QSize(14, 14))
+
+    ql5 = QtWidgets.QLabel(" \n6. Larger Icon:")
+    sc5 = SegmentedControl.SegmentedControl()
+    sc5.AppendSegmentButton("", os.path.join(IMAGES_DIR, "img30x30.png"), QtCore.QSize(30, 30))
+    sc5.AppendSegmentButton("", os.path.join(IMAGES_DIR, "img30x30.png"), QtCore.QSize(30, 30))
+    sc5.AppendSegmentButton("", os.path.join(IMAGES_DIR, "img30x30.png"), QtCore.QSize(30, 30))
+
+    ql6 = QtWidgets.QLabel(" \n6. Mixed, Four Buttons, Initial Selection:")
+    sc6 = SegmentedControl.SegmentedControl()
+    sc6.AppendSegmentButton("No")
+    sc6.AppendSegmentButton("Yes", os.path.join(IMAGES_DIR, "img10x10.png"), QtCore.QSize(10, 10))
+    sc6.AppendSegmentButton("", os.path.join(IMAGES_DIR, "img20x20.png"), QtCore.QSize(20, 20))
+    sc6.AppendSegmentButton("", os.path.join(IMAGES_DIR, "img30x30.png"), QtCore.QSize(30, 30))
+
+    sc6.setButtonState(1, True)
+    print(sc6.getButtonState(0))
+
+    sc6_state = sc6.getControlState()
+    print(sc6_state)
+
+    for i in [0, 1, 2, 3]:
+        print(sc6.getButtonState(i))
+    # ----------------
+
+
+    # Hooking up the button-based callbacks
+    # ++++++++++++++++
+    # Clicked
+    sc0.buttonClicked.connect(firstRowClickedButton)
+    sc1.buttonClicked.connect(secondRowClickedButton)
+    sc2.buttonClicked.connect(thirdRowClickedButton)
+    sc3.buttonClicked.connect(fourthRowClickedButton)
+    # sc4.buttonClicked.connect(fifthRowClickedButton)
+    # sc5.buttonClicked.connect(sixthRowClickedButton)
+    # sc6.buttonClicked.connect(seventhRowClickedButton)
+    '''
+    # Pressed
+    sc0.buttonPressed.connect(firstRowPressedButton)
+    sc1.buttonPressed.connect(secondRowPressedButton)
+    sc2.buttonPressed.connect(thirdRowPressedButton)
+    sc3.buttonPressed.connect(fourthRowPressedButton)
+    sc4.buttonPressed.connect(fifthRowPressedButton)
+    sc5.buttonPressed.connect(sixthRowPressedButton)
+    sc6.buttonPressed.connect(seventhRowPressedButton)
+    #Released
+    sc0.buttonReleased.connect(firstRowReleasedButton)
+    sc1.buttonReleased.connect(secondRowReleasedButton)
+    sc2.buttonReleased.connect(thirdRowReleasedButton)
+    sc3.buttonReleased.connect(fourthRowReleasedButton)
+    sc4.buttonReleased.connect(fifthRowReleasedButton)
+    sc5.buttonReleased.connect(sixthRowReleasedButton)
+    sc6.buttonReleased.connect(seventhRowReleasedButton)
+    '''
+
+    '''
+    #Hooking up buttonID-based callbacks
+    #Clicked
+    sc0.buttonIdClicked.connect(firstRowClickedButtonId)
+    sc1.buttonIdClicked.connect(secondRowClickedButtonId)
+    sc2.buttonIdClicked.connect(thirdRowClickedButtonId)
+    sc3.buttonIdClicked.connect(fourthRowClickedButtonId)
+    sc4.buttonIdClicked.connect(fifthRowClickedButtonId)
+    sc5.buttonIdClicked.connect(sixthRowClickedButtonId)
+    sc6.buttonIdClicked.connect(seventhRowClickedButtonId)
+    #Pressed
+    sc0.buttonIdPressed.connect(firstRowPressedButtonId)
+    sc1.buttonIdPressed.connect(secondRowPressedButtonId)
+    sc2.buttonIdPressed.connect(thirdRowPressedButtonId)
+    sc3.buttonIdPressed.connect(fourthRowPressedButtonId)
+    sc4.buttonIdPressed.connect(fifthRowPressedButtonId)
+    sc5.buttonIdPressed.connect(sixthRowPressedButtonId)
+    sc6.buttonIdPressed.connect(seventhRowPressedButtonId)
+    #Released
+    sc0.buttonIdReleased.connect(firstRowReleasedButtonId)
+    sc1.buttonIdReleased.connect(secondRowReleasedButtonId)
+    sc2.buttonIdReleased.connect(thirdRowReleasedButtonId)
+    sc3.buttonIdReleased.connect(fourthRowReleasedButtonId)
+    '''
+    sc4.buttonIdReleased.connect(fifthRowReleasedButtonId)
+    sc5.buttonIdReleased.connect(sixthRowReleasedButtonId)
+    sc6.buttonIdReleased.connect(seventhRowReleasedButtonId)
+
+    # ----------------
+
+    vlayout.addWidget(ql0)
+    vlayout.addWidget(sc0)
+
+    vlayout.addWidget(ql1)
+    vlayout.addWidget(sc1)
+
+    vlayout.addWidget(ql2)
+    vlayout.addWidget(sc2)
+
+    vlayout.addWidget(ql3)
+    vlayout.addWidget(sc3)
+
+    vlayout.addWidget(ql4)
+    vlayout.addWidget(sc4)
+
+    vlayout.addWidget(ql5)
+    vlayout.addWidget(sc5)
+
+    vlayout.addWidget(ql6)
+    vlayout.addWidget(sc6)
+
+    widget.setGeometry(0, 0, 400, 400)
+    widget.setWindowTitle('Segmented Buttons')
+    widget.show()
+
+
+    return qt.execApplication(app)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# ------------------------------------------------------------------------------